@@ -118,7 +118,8 @@ SIMULACION = {
     "TAXIS_ACTIVOS_MAX": 10,
     "SOLICITUDES_POR_CLIENTE": (1, 3),  # Min y max solicitudes
     "DELAY_ENTRE_SOLICITUDES": (0.1, 0.5),  # Segundos
-    "TIEMPO_SIMULACION_DIA": 6.0  # Segundos reales por día simulado (aumentado para más actividad)
+    "TIEMPO_SIMULACION_DIA": 6.0,  # Segundos reales por día simulado (aumentado para más actividad)
+    "MAX_HILOS_CLIENTES": 10  # Hilos reutilizables del pool que atiende a los clientes
 }
 
 # ==================== COLORES PARA VISUALIZACIÓN ====================
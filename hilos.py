@@ -10,9 +10,9 @@ Este módulo evita importaciones circulares al centralizar los hilos.
 
 import time
 import random
-import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import config
-from sistema_central import SistemaCentral
+from sistema_central import SistemaCentral, logger
 
 
 def hilo_cliente(sistema: SistemaCentral, cliente, num_solicitudes: int = 1):
@@ -39,7 +39,7 @@ def hilo_cliente(sistema: SistemaCentral, cliente, num_solicitudes: int = 1):
 
         except Exception as e:
             # Registrar error leve y continuar
-            print(f"⚠️ Error en hilo_cliente: {e}")
+            logger.warning("⚠️ Error en hilo_cliente: %s", e)
         finally:
             # Finalizar servicio (reducir contador de servicios)
             try:
@@ -55,49 +55,47 @@ def hilo_sistema_principal(sistema: SistemaCentral):
     """
     Hilo principal que recorre los días de simulación del sistema.
 
-    Ejecuta: iniciar_nuevo_dia(), crea hilos de clientes, espera, finalizar_dia().
+    Ejecuta: iniciar_nuevo_dia(), envía los clientes al pool, espera, finalizar_dia().
+    Los hilos del pool se reutilizan entre clientes y días.
     """
-    import random
+    max_hilos = config.SIMULACION.get('MAX_HILOS_CLIENTES', 10)
     
-    for dia in range(sistema.num_dias):
-        sistema.iniciar_nuevo_dia()
-        
-        # ✅ CREAR HILOS DE CLIENTES PARA ESTE DÍA
-        hilos_clientes = []
-        clientes_activos = sistema.clientes[:min(10, len(sistema.clientes))]
-        
-        for cliente in clientes_activos:
-            # Asignar ubicaciones aleatorias cada día
+    with ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix="cliente") as pool:
+        for dia in range(sistema.num_dias):
+            sistema.iniciar_nuevo_dia()
+            
+            # ✅ ENVIAR CLIENTES DE ESTE DÍA AL POOL
+            tareas_clientes = []
+            clientes_activos = sistema.clientes[:min(10, len(sistema.clientes))]
+            
+            for cliente in clientes_activos:
+                # Asignar ubicaciones aleatorias cada día
+                try:
+                    punto = random.choice(config.PUNTOS_INICIO_TAXIS)
+                    destino = random.choice(config.RUTA_PRINCIPAL)
+                    cliente.ubicacion_actual = (punto[0], punto[1])
+                    cliente.destino = (destino[0], destino[1])
+                except Exception:
+                    pass
+                
+                # Tarea para este cliente (1-3 solicitudes por día)
+                num_solicitudes = random.randint(1, 3)
+                tareas_clientes.append(
+                    pool.submit(hilo_cliente, sistema, cliente, num_solicitudes)
+                )
+                time.sleep(0.1)
+            
+            # Esperar la duración configurada de simulación por día
+            duracion = getattr(config, 'SIMULACION', {}).get('TIEMPO_SIMULACION_DIA', 6.0)
             try:
-                punto = random.choice(config.PUNTOS_INICIO_TAXIS)
-                destino = random.choice(config.RUTA_PRINCIPAL)
-                cliente.ubicacion_actual = (punto[0], punto[1])
-                cliente.destino = (destino[0], destino[1])
+                time.sleep(duracion)
             except Exception:
-                pass
+                time.sleep(2.0)
             
-            # Crear hilo para este cliente (1-3 solicitudes por día)
-            num_solicitudes = random.randint(1, 3)
-            hilo = threading.Thread(
-                target=hilo_cliente,
-                args=(sistema, cliente, num_solicitudes)
-            )
-            hilos_clientes.append(hilo)
-            hilo.start()
-            time.sleep(0.1)
-        
-        # Esperar la duración configurada de simulación por día
-        duracion = getattr(config, 'SIMULACION', {}).get('TIEMPO_SIMULACION_DIA', 6.0)
-        try:
-            time.sleep(duracion)
-        except Exception:
-            time.sleep(2.0)
-        
-        # Esperar a que terminen todos los hilos de este día
-        for hilo in hilos_clientes:
-            hilo.join(timeout=2.0)
-        
-        sistema.finalizar_dia()
+            # Esperar a que terminen las tareas de este día
+            wait(tareas_clientes, timeout=2.0)
+            
+            sistema.finalizar_dia()
 
     sistema.fin_sistema = True
-    print("✅ hilo_sistema_principal: Simulación completada")
+    logger.info("✅ hilo_sistema_principal: Simulación completada")
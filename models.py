@@ -11,7 +11,7 @@ import config
 
 # ==================== CLASE CLIENTE ====================
 
-@dataclass
+@dataclass(slots=True)
 class Cliente:
     """
     Representa un cliente del sistema UNIETAXI.
@@ -84,7 +84,7 @@ class Cliente:
 
 # ==================== CLASE TAXI ====================
 
-@dataclass
+@dataclass(slots=True)
 class Taxi:
     """
     Representa un taxi del sistema UNIETAXI.
@@ -217,7 +217,7 @@ class Taxi:
 
 # ==================== CLASE SERVICIO ====================
 
-@dataclass
+@dataclass(slots=True)
 class Servicio:
     """
     Representa un servicio de taxi.
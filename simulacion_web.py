@@ -14,7 +14,8 @@ import json
 import os
 import time
 import threading
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import webbrowser
 
@@ -30,24 +31,30 @@ class SimulacionWebGenerator:
     
     def __init__(self, sistema: SistemaCentral):
         self.sistema = sistema
-        self.eventos = []  # Log de eventos para mostrar
+        self.eventos = deque(maxlen=50)  # Log de eventos (últimos 50)
+        self._eventos_recientes = deque(maxlen=20)  # Últimos 20, listos para la web
         self.archivo_html = os.path.join(config.BASE_DIR, "simulacion_tiempo_real.html")
         self.archivo_datos = os.path.join(config.DATA_DIR, "simulacion_live.json")
         self.running = True
         
+        # Descriptor abierto en la primera escritura y reutilizado durante
+        # toda la simulación: el JSON live es un canal efímero, se sobrescribe
+        # en sitio sin reabrir ni hacer fsync
+        self._fd_datos = None
+        self._cerrado = False
+        self._lock_datos = threading.Lock()
+        
     def agregar_evento(self, tipo: str, mensaje: str, datos: dict = None):
         """Agrega un evento al log"""
+        lt = time.localtime()
         evento = {
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}",
             "tipo": tipo,
             "mensaje": mensaje,
             "datos": datos or {}
         }
         self.eventos.append(evento)
-        
-        # Mantener solo los últimos 50 eventos
-        if len(self.eventos) > 50:
-            self.eventos.pop(0)
+        self._eventos_recientes.append(evento)
         
         # Actualizar archivo de datos
         self.actualizar_datos_live()
@@ -55,12 +62,12 @@ class SimulacionWebGenerator:
     def actualizar_datos_live(self):
         """Actualiza el archivo JSON con datos en tiempo real"""
         datos = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
             "dia_actual": self.sistema.dia_actual,
             "servicios_activos": self.sistema.servicios_activos,
             "total_servicios": len(self.sistema.servicios_completados),
             "ganancia_empresa": round(self.sistema.ganancia_total_empresa, 2),
-            "eventos": self.eventos[-20:],  # Últimos 20 eventos
+            "eventos": list(self._eventos_recientes),  # Últimos 20 eventos
             "taxis": [],
             "clientes_activos": [],
             "estadisticas": {
@@ -96,9 +103,35 @@ class SimulacionWebGenerator:
                     "taxi_asignado": cliente.taxi_asignado
                 })
         
-        # Guardar
-        with open(self.archivo_datos, 'w', encoding='utf-8') as f:
-            json.dump(datos, f, indent=2, ensure_ascii=False)
+        # Guardar (sobrescribir desde el inicio y recortar el sobrante)
+        blob = json.dumps(datos, indent=2, ensure_ascii=False).encode('utf-8')
+        with self._lock_datos:
+            if self._cerrado:
+                return
+            if self._fd_datos is None:
+                # Sin O_TRUNC: el ftruncate de abajo recorta el sobrante
+                self._fd_datos = os.open(
+                    self.archivo_datos,
+                    os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                    0o644
+                )
+            os.lseek(self._fd_datos, 0, os.SEEK_SET)
+            os.write(self._fd_datos, blob)
+            os.ftruncate(self._fd_datos, len(blob))
+    
+    def cerrar(self):
+        """Cierra el archivo de datos en tiempo real"""
+        with self._lock_datos:
+            self._cerrado = True
+            if self._fd_datos is not None:
+                os.close(self._fd_datos)
+                self._fd_datos = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.cerrar()
     
     def generar_html(self):
         """Genera el archivo HTML de la simulación"""
@@ -313,18 +346,6 @@ class SimulacionWebGenerator:
             100% {{ transform: rotate(360deg); }}
         }}
         
-        .taxi-marker {{
-            width: 40px;
-            height: 40px;
-            border: 3px solid #fff;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 22px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.4);
-        }}
-        
         .cliente-marker {{
             width: 35px;
             height: 35px;
@@ -405,12 +426,21 @@ class SimulacionWebGenerator:
         // Variables globales
         let map;
         let taxiMarkers = {{}};
+        let taxiAnim = {{}};  // Interpolación por taxi: prev, next, t0
+        let animando = false;  // Hay un requestAnimationFrame pendiente
+        let taxiRenderer;
         let clienteMarkers = {{}};
         let routeLines = {{}};
         
+        // Periodo de sondeo del JSON live (ms); la interpolación dura lo mismo
+        // para que cada taxi llegue a su posición justo cuando llega la siguiente
+        const INTERVALO_ACTUALIZACION = {config.TIEMPO_REAL["UPDATE_INTERVAL_MS"]};
+        const DURACION_INTERPOLACION = INTERVALO_ACTUALIZACION;
+        
         // Inicializar mapa
         function initMap() {{
-            map = L.map('map').setView([{centro['lat']}, {centro['lng']}], 13);
+            map = L.map('map', {{ preferCanvas: true }}).setView([{centro['lat']}, {centro['lng']}], 13);
+            taxiRenderer = L.canvas();
             
             L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
                 attribution: '© OpenStreetMap | UNIETAXI'
@@ -472,16 +502,27 @@ class SimulacionWebGenerator:
             taxis.forEach(taxi => {{
                 // Actualizar marcador en mapa
                 if (!taxiMarkers[taxi.id]) {{
-                    const icon = L.divIcon({{
-                        className: 'taxi-marker',
-                        html: `<div style="background: ${{taxi.color}}; width: 100%; height: 100%; border-radius: 50%; display: flex; align-items: center; justify-content: center;">🚕</div>`,
-                        iconSize: [40, 40]
-                    }});
-                    
-                    taxiMarkers[taxi.id] = L.marker(taxi.ubicacion, {{ icon: icon }}).addTo(map);
+                    taxiMarkers[taxi.id] = L.circleMarker(taxi.ubicacion, {{
+                        radius: 12,
+                        color: '#fff',
+                        weight: 3,
+                        fillColor: taxi.color,
+                        fillOpacity: 0.9,
+                        renderer: taxiRenderer
+                    }}).addTo(map);
                 }} else {{
-                    // Animar movimiento
-                    taxiMarkers[taxi.id].setLatLng(taxi.ubicacion);
+                    // Animar movimiento: interpolar desde la posición actual
+                    const siguiente = L.latLng(taxi.ubicacion);
+                    const anim = taxiAnim[taxi.id];
+                    const destino = anim ? anim.next : taxiMarkers[taxi.id].getLatLng();
+                    if (!destino.equals(siguiente)) {{
+                        taxiAnim[taxi.id] = {{
+                            prev: taxiMarkers[taxi.id].getLatLng(),
+                            next: siguiente,
+                            t0: performance.now()
+                        }};
+                        iniciarAnimacion();
+                    }}
                 }}
                 
                 // Actualizar popup
@@ -511,35 +552,81 @@ class SimulacionWebGenerator:
             }});
         }}
         
+        // Arrancar el bucle de animación si no está en marcha
+        function iniciarAnimacion() {{
+            if (!animando) {{
+                animando = true;
+                requestAnimationFrame(animarTaxis);
+            }}
+        }}
+        
+        // Avanzar la interpolación de todos los taxis en un único frame;
+        // el bucle se detiene cuando no queda ninguna interpolación
+        function animarTaxis(ahora) {{
+            let restantes = 0;
+            Object.keys(taxiAnim).forEach(id => {{
+                const anim = taxiAnim[id];
+                const t = Math.min(1, (ahora - anim.t0) / DURACION_INTERPOLACION);
+                taxiMarkers[id].setLatLng([
+                    anim.prev.lat + (anim.next.lat - anim.prev.lat) * t,
+                    anim.prev.lng + (anim.next.lng - anim.prev.lng) * t
+                ]);
+                if (t >= 1) {{
+                    delete taxiAnim[id];
+                }} else {{
+                    restantes++;
+                }}
+            }});
+            if (restantes > 0) {{
+                requestAnimationFrame(animarTaxis);
+            }} else {{
+                animando = false;
+            }}
+        }}
+        
         // Actualizar clientes en mapa
         function actualizarClientes(clientes) {{
-            // Limpiar marcadores antiguos
-            Object.values(clienteMarkers).forEach(marker => map.removeLayer(marker));
-            clienteMarkers = {{}};
-            
-            // Limpiar líneas de ruta
-            Object.values(routeLines).forEach(line => map.removeLayer(line));
-            routeLines = {{}};
+            // Reutilizar marcadores y líneas existentes por cédula
+            const prevIds = new Set(Object.keys(clienteMarkers));
+            const seen = new Set();
             
             clientes.forEach(cliente => {{
-                // Marcador de cliente
-                const icon = L.divIcon({{
-                    className: 'cliente-marker',
-                    html: '<div>🧍</div>',
-                    iconSize: [35, 35]
-                }});
+                const id = String(cliente.cedula);
+                seen.add(id);
                 
-                clienteMarkers[cliente.cedula] = L.marker(cliente.ubicacion, {{ icon: icon }}).addTo(map);
-                clienteMarkers[cliente.cedula].bindPopup(`<b>${{cliente.nombre}}</b><br>Taxi: ${{cliente.taxi_asignado}}`);
+                if (!clienteMarkers[id]) {{
+                    // Marcador de cliente
+                    const icon = L.divIcon({{
+                        className: 'cliente-marker',
+                        html: '<div>🧍</div>',
+                        iconSize: [35, 35]
+                    }});
+                    clienteMarkers[id] = L.marker(cliente.ubicacion, {{ icon: icon }}).addTo(map);
+                    
+                    // Línea hacia destino
+                    routeLines[id] = L.polyline([cliente.ubicacion, cliente.destino], {{
+                        color: '#3498db',
+                        weight: 2,
+                        dashArray: '5, 10',
+                        opacity: 0.6
+                    }}).addTo(map);
+                }} else {{
+                    clienteMarkers[id].setLatLng(cliente.ubicacion);
+                    routeLines[id].setLatLngs([cliente.ubicacion, cliente.destino]);
+                }}
                 
-                // Línea hacia destino
-                routeLines[cliente.cedula] = L.polyline([cliente.ubicacion, cliente.destino], {{
-                    color: '#3498db',
-                    weight: 2,
-                    dashArray: '5, 10',
-                    opacity: 0.6
-                }}).addTo(map);
+                clienteMarkers[id].bindPopup(`<b>${{cliente.nombre}}</b><br>Taxi: ${{cliente.taxi_asignado}}`);
             }});
+            
+            // Eliminar solo los clientes que ya no están en servicio
+            for (const id of prevIds) {{
+                if (!seen.has(id)) {{
+                    map.removeLayer(clienteMarkers[id]);
+                    delete clienteMarkers[id];
+                    map.removeLayer(routeLines[id]);
+                    delete routeLines[id];
+                }}
+            }}
         }}
         
         // Actualizar eventos
@@ -563,8 +650,8 @@ class SimulacionWebGenerator:
             initMap();
             document.getElementById('loading').style.display = 'none';
             
-            // Actualizar cada 500ms
-            setInterval(actualizarDatos, 500);
+            // Sondear el JSON live con el periodo de config.TIEMPO_REAL
+            setInterval(actualizarDatos, INTERVALO_ACTUALIZACION);
             actualizarDatos();
         }});
     </script>
@@ -659,122 +746,122 @@ def iniciar_simulacion_web(num_dias: int = 2):
     # Crear directorio data si no existe
     os.makedirs(config.DATA_DIR, exist_ok=True)
     
-    # Crear sistema
-    web_gen = SimulacionWebGenerator(None)  # Temporal
-    sistema = SistemaCentralWeb(num_dias=num_dias, web_gen=web_gen)
-    web_gen.sistema = sistema
-    
-    # Cargar datos
-    print("\n📂 Cargando datos...")
-    num_taxis = cargar_taxis_desde_json(sistema)
-    num_clientes = cargar_clientes_desde_json(sistema)
-    
-    # Si no hay datos, usar ejemplos
-    if num_taxis == 0:
-        print("⚠️ Usando taxis de ejemplo...")
-        for i in range(5):
-            sistema.afiliar_taxi(
-                100000 + i, f"Taxi{i+1}", "Driver", f"TX{i+1:03d}",
-                "Toyota", "Corolla", 60
-            )
-    
-    if num_clientes == 0:
-        print("⚠️ Usando clientes de ejemplo...")
-        for i in range(8):
-            sistema.afiliar_cliente(
-                200000 + i, f"Cliente{i+1}", "Test", "4532123456789012"
-            )
-            # Asignar ubicación y destino aleatorios dentro de los puntos conocidos
-            try:
-                cliente = sistema.clientes[-1]
-                punto = random.choice(config.PUNTOS_INICIO_TAXIS)
-                destino = random.choice(config.RUTA_PRINCIPAL)
-                cliente.ubicacion_actual = (punto[0], punto[1])
-                cliente.destino = (destino[0], destino[1])
-            except Exception:
-                pass
-    
-    print(f"\n✅ Sistema listo:")
-    print(f"   🚖 Taxis: {len(sistema.taxis)}")
-    print(f"   🧍 Clientes: {len(sistema.clientes)}")
-    print(f"   📅 Días: {num_dias}")
-    
-    # Generar HTML
-    print("\n🌐 Generando interfaz web...")
-    archivo_html = web_gen.generar_html()
-    
-    # Inicializar datos live
-    web_gen.actualizar_datos_live()
-    
-    # Iniciar hilo del sistema
-    def sistema_thread():
-        """Hilo principal que ejecuta la simulación día por día"""
-        for dia in range(sistema.num_dias):
-            sistema.iniciar_nuevo_dia()
-            
-            # ✅ CREAR HILOS DE CLIENTES PARA ESTE DÍA
-            print(f"👥 Activando clientes para el día {dia + 1}...")
-            hilos_clientes = []
-            
-            for cliente in sistema.clientes[:10]:
-                # Asignar ubicaciones aleatorias cada día
+    # Crear sistema (el with cierra el JSON live también si algo falla)
+    with SimulacionWebGenerator(None) as web_gen:  # sistema temporal
+        sistema = SistemaCentralWeb(num_dias=num_dias, web_gen=web_gen)
+        web_gen.sistema = sistema
+        
+        # Cargar datos
+        print("\n📂 Cargando datos...")
+        num_taxis = cargar_taxis_desde_json(sistema)
+        num_clientes = cargar_clientes_desde_json(sistema)
+        
+        # Si no hay datos, usar ejemplos
+        if num_taxis == 0:
+            print("⚠️ Usando taxis de ejemplo...")
+            for i in range(5):
+                sistema.afiliar_taxi(
+                    100000 + i, f"Taxi{i+1}", "Driver", f"TX{i+1:03d}",
+                    "Toyota", "Corolla", 60
+                )
+        
+        if num_clientes == 0:
+            print("⚠️ Usando clientes de ejemplo...")
+            for i in range(8):
+                sistema.afiliar_cliente(
+                    200000 + i, f"Cliente{i+1}", "Test", "4532123456789012"
+                )
+                # Asignar ubicación y destino aleatorios dentro de los puntos conocidos
                 try:
+                    cliente = sistema.clientes[-1]
                     punto = random.choice(config.PUNTOS_INICIO_TAXIS)
                     destino = random.choice(config.RUTA_PRINCIPAL)
                     cliente.ubicacion_actual = (punto[0], punto[1])
                     cliente.destino = (destino[0], destino[1])
-                except Exception as e:
-                    print(f"⚠️ Error asignando ubicación a cliente: {e}")
-                
-                # Crear hilo para este cliente (1-3 solicitudes por día)
-                num_solicitudes = random.randint(1, 3)
-                hilo = threading.Thread(
-                    target=hilo_cliente,
-                    args=(sistema, cliente, num_solicitudes)
-                )
-                hilos_clientes.append(hilo)
-                hilo.start()
-                time.sleep(0.1)  # Pequeña pausa entre creaciones
-            
-            # Esperar a que los clientes procesen sus solicitudes
-            duracion = config.SIMULACION.get('TIEMPO_SIMULACION_DIA', 6.0)
-            print(f"⏳ Simulando actividad del día {dia + 1} ({duracion} segundos)...")
-            time.sleep(duracion)
+                except Exception:
+                    pass
+        
+        print(f"\n✅ Sistema listo:")
+        print(f"   🚖 Taxis: {len(sistema.taxis)}")
+        print(f"   🧍 Clientes: {len(sistema.clientes)}")
+        print(f"   📅 Días: {num_dias}")
+        
+        # Generar HTML
+        print("\n🌐 Generando interfaz web...")
+        archivo_html = web_gen.generar_html()
+        
+        # Inicializar datos live
+        web_gen.actualizar_datos_live()
+        
+        # Iniciar hilo del sistema
+        def sistema_thread():
+            """Hilo principal que ejecuta la simulación día por día"""
+            max_hilos = config.SIMULACION.get('MAX_HILOS_CLIENTES', 10)
             
-            # Esperar a que terminen todos los hilos (máximo 2 segundos adicionales)
-            print(f"⏸️ Esperando finalización de hilos del día {dia + 1}...")
-            for hilo in hilos_clientes:
-                hilo.join(timeout=2.0)
+            # Un único pool de hilos atiende a los clientes de todos los días
+            with ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix="cliente") as pool:
+                for dia in range(sistema.num_dias):
+                    sistema.iniciar_nuevo_dia()
+                    
+                    # ✅ ENVIAR CLIENTES DE ESTE DÍA AL POOL
+                    print(f"👥 Activando clientes para el día {dia + 1}...")
+                    tareas_clientes = []
+                    
+                    for cliente in sistema.clientes[:10]:
+                        # Asignar ubicaciones aleatorias cada día
+                        try:
+                            punto = random.choice(config.PUNTOS_INICIO_TAXIS)
+                            destino = random.choice(config.RUTA_PRINCIPAL)
+                            cliente.ubicacion_actual = (punto[0], punto[1])
+                            cliente.destino = (destino[0], destino[1])
+                        except Exception as e:
+                            print(f"⚠️ Error asignando ubicación a cliente: {e}")
+                        
+                        # Tarea para este cliente (1-3 solicitudes por día)
+                        num_solicitudes = random.randint(1, 3)
+                        tareas_clientes.append(
+                            pool.submit(hilo_cliente, sistema, cliente, num_solicitudes)
+                        )
+                        time.sleep(0.1)  # Pequeña pausa entre solicitudes
+                    
+                    # Esperar a que los clientes procesen sus solicitudes
+                    duracion = config.SIMULACION.get('TIEMPO_SIMULACION_DIA', 6.0)
+                    print(f"⏳ Simulando actividad del día {dia + 1} ({duracion} segundos)...")
+                    time.sleep(duracion)
+                    
+                    # Esperar a que terminen las tareas (máximo 2 segundos adicionales)
+                    print(f"⏸️ Esperando finalización de clientes del día {dia + 1}...")
+                    wait(tareas_clientes, timeout=2.0)
+                    
+                    # Finalizar el día
+                    sistema.finalizar_dia()
             
-            # Finalizar el día
-            sistema.finalizar_dia()
+            # Marcar fin del sistema
+            sistema.fin_sistema = True
+            web_gen.agregar_evento("sistema", "🏁 Simulación finalizada", {})
+            print("\n✅ Simulación completada")
         
-        # Marcar fin del sistema
-        sistema.fin_sistema = True
-        web_gen.agregar_evento("sistema", "🏁 Simulación finalizada", {})
-        print("\n✅ Simulación completada")
-    
-    hilo_sistema = threading.Thread(target=sistema_thread, daemon=True)
-    hilo_sistema.start()
-    
-    # Abrir navegador
-    print(f"\n🌐 Abriendo navegador en: {archivo_html}")
-    webbrowser.open('file://' + os.path.abspath(archivo_html))
-    
-    print("\n✅ Simulación web iniciada")
-    print("📊 La página se actualiza automáticamente cada 500ms")
-    print("⏹️  Presiona Ctrl+C para detener\n")
-    
-    # Mantener el script corriendo
-    try:
-        while not sistema.fin_sistema:
-            time.sleep(1)
-            web_gen.actualizar_datos_live()
-    except KeyboardInterrupt:
-        print("\n\n⚠️ Simulación detenida por el usuario")
-    
-    # Generar reporte final
-    sistema.generar_reporte_mensual()
+        hilo_sistema = threading.Thread(target=sistema_thread, daemon=True)
+        hilo_sistema.start()
+        
+        # Abrir navegador
+        print(f"\n🌐 Abriendo navegador en: {archivo_html}")
+        webbrowser.open('file://' + os.path.abspath(archivo_html))
+        
+        print("\n✅ Simulación web iniciada")
+        print(f"📊 La página se actualiza automáticamente cada {config.TIEMPO_REAL['UPDATE_INTERVAL_MS']}ms")
+        print("⏹️  Presiona Ctrl+C para detener\n")
+        
+        # Mantener el script corriendo
+        try:
+            while not sistema.fin_sistema:
+                time.sleep(1)
+                web_gen.actualizar_datos_live()
+        except KeyboardInterrupt:
+            print("\n\n⚠️ Simulación detenida por el usuario")
+        
+        # Generar reporte final
+        sistema.generar_reporte_mensual()
     print("\n✅ Sistema finalizado")
 
 
@@ -3,7 +3,7 @@ sistema_central.py - Sistema Central de Atención al Cliente UNIETAXI
 
 Este es el núcleo del sistema que implementa:
 - Gestión de hilos concurrentes
-- Sincronización con semáforos
+- Sincronización con locks y eventos
 - Asignación cliente-taxi
 - Reportes y cierre contable
 """
@@ -12,13 +12,120 @@ import threading
 import time
 import random
 import math
+import re
 import json
-from typing import List, Optional
-from queue import Queue
+import os
+import stat
+import itertools
+import sys
+import logging
+import tempfile
+from contextlib import contextmanager
+from typing import List, Optional, Set
+from queue import SimpleQueue
 
 import config
 from models import Cliente, Taxi, Servicio
 
+# ==================== CONSTANTES DE CONFIGURACIÓN ====================
+# Valores de config usados en rutas calientes, resueltos una sola vez al importar
+
+_RADIO_BUSQUEDA_SQ = config.TAXI_CONFIG["RADIO_BUSQUEDA_KM"]**2
+_TARIFA_METRO = config.TAXI_CONFIG.get("TARIFA_POR_METRO")
+_TARIFA_KM = config.TAXI_CONFIG["TARIFA_POR_KM"]
+_COMISION = config.TAXI_CONFIG["COMISION_EMPRESA"]
+_PCT_COMISION = int(_COMISION * 100)
+_PCT_TAXISTA = int((1 - _COMISION) * 100)
+_SERVICIOS_SEGUIMIENTO = config.SEGUIMIENTO["SERVICIOS_POR_DIA"]
+
+# Tarjeta: se quitan espacios y guiones en una pasada y se valida con un regex
+_CARD_STRIP = str.maketrans("", "", " -")
+_CARD_RE = re.compile(rf"[0-9]{{{config.VALIDACIONES['TARJETA_DIGITOS']}}}")
+
+# ==================== LOGGING ====================
+# Escritura síncrona en stdout: los registros salen en orden con los print
+# de main.py, hilos.py y las pruebas, y cada registro se escribe de una vez.
+# Con LOG_CONFIG["NIVEL"] = "WARNING" se silencia la traza por servicio.
+
+logger = logging.getLogger("unietaxi")
+
+
+def _configurar_logger():
+    """Conecta el logger a stdout con el mismo formato que print"""
+    salida = logging.StreamHandler(sys.stdout)
+    salida.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(salida)
+    logger.setLevel(config.LOG_CONFIG["NIVEL"])
+    logger.propagate = False
+
+
+_configurar_logger()
+
+# ==================== LOCK LECTORES-ESCRITOR ====================
+
+class RWLock:
+    """
+    Lock lectores-escritor con preferencia de escritura.
+    
+    Varios lectores pueden estar dentro a la vez; un escritor entra solo.
+    En cuanto un escritor espera, no se admiten lectores nuevos, de modo
+    que los escritores no sufren inanición ante un flujo continuo de lecturas.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escritor_activo = False
+        self._escritores_esperando = 0
+    
+    def acquire_read(self):
+        """Entra como lector (espera si hay un escritor activo o esperando)"""
+        with self._cond:
+            while self._escritor_activo or self._escritores_esperando:
+                self._cond.wait()
+            self._lectores += 1
+    
+    def release_read(self):
+        """Sale como lector; el último lector despierta a los escritores"""
+        with self._cond:
+            self._lectores -= 1
+            if self._lectores == 0:
+                self._cond.notify_all()
+    
+    def acquire_write(self):
+        """Entra como escritor (espera a que salgan lectores y escritores)"""
+        with self._cond:
+            self._escritores_esperando += 1
+            while self._escritor_activo or self._lectores:
+                self._cond.wait()
+            self._escritores_esperando -= 1
+            self._escritor_activo = True
+    
+    def release_write(self):
+        """Sale como escritor y despierta a todos los que esperan"""
+        with self._cond:
+            self._escritor_activo = False
+            self._cond.notify_all()
+    
+    @contextmanager
+    def read_locked(self):
+        """Context manager para una sección de lectura"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+    
+    @contextmanager
+    def write_locked(self):
+        """Context manager para una sección de escritura"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
 # ==================== SISTEMA CENTRAL ====================
 
 class SistemaCentral:
@@ -39,7 +146,15 @@ class SistemaCentral:
         self.clientes: List[Cliente] = []
         self.servicios_completados: List[Servicio] = []
         self.servicios_seguimiento: List[Servicio] = []
-        self.cola_solicitudes: Queue = Queue()
+        self.cola_solicitudes: SimpleQueue = SimpleQueue()
+        
+        # Diccionarios ya exportados de servicios_completados (un servicio
+        # registrado no vuelve a cambiar, así que basta con añadir los nuevos)
+        self._servicios_exportados: List[dict] = []
+        
+        # Índices para verificar duplicados en O(1) al afiliar
+        self._cedulas_clientes: Set[int] = set()
+        self._placas_taxis: Set[str] = set()
         
         # ==================== CONTROL DE SISTEMA ====================
         self.num_dias = num_dias
@@ -47,47 +162,69 @@ class SistemaCentral:
         self.servicios_activos = 0
         self.fin_del_dia = False
         self.fin_sistema = False
-        self.contador_servicios = 0
-        
-        # ==================== SEMÁFOROS PARA SINCRONIZACIÓN ====================
-        # SECCIÓN CRÍTICA 1: Lista de taxis
-        self.mutex_taxis = threading.Semaphore(1)
-        
-        # SECCIÓN CRÍTICA 2: Lista de clientes
-        self.mutex_clientes = threading.Semaphore(1)
+        # next() sobre itertools.count es atómico: IDs únicos sin lock
+        self.contador_servicios = itertools.count(1)
         
-        # SECCIÓN CRÍTICA 3: Función match (asignación)
-        self.mutex_match = threading.Semaphore(1)
+        # ==================== LOCKS PARA SINCRONIZACIÓN ====================
+        # SECCIÓN CRÍTICA 1: Lista de taxis (lectores-escritor: las búsquedas
+        # leen en paralelo; afiliación y cierre contable escriben en exclusiva)
+        self.rw_taxis = RWLock()
         
-        # SECCIÓN CRÍTICA 4: Control de fin del día
-        self.mutex_fin_del_dia = threading.Semaphore(1)
+        # SECCIÓN CRÍTICA 2: Reserva del taxi elegido en el match (la búsqueda
+        # va antes, bajo lectura de rw_taxis)
+        self.mutex_match = threading.Lock()
         
-        # SECCIÓN CRÍTICA 5: Servicios de seguimiento
-        self.mutex_servicios_seguimiento = threading.Semaphore(1)
+        # SECCIÓN CRÍTICA 3: Control de fin del día
+        self.mutex_fin_del_dia = threading.Lock()
         
-        # SECCIÓN CRÍTICA 6: Servicios completados
-        self.mutex_servicios_completados = threading.Semaphore(1)
+        # SECCIÓN CRÍTICA 4: Servicios completados y de seguimiento
+        self.mutex_servicios = threading.Lock()
         
-        # SECCIÓN CRÍTICA 7: Cola de solicitudes
-        self.mutex_solicitudes = threading.Semaphore(1)
+        # SECCIÓN CRÍTICA 5: Afiliaciones (también protege la lista de clientes;
+        # cola_solicitudes es una SimpleQueue y no necesita lock propio)
+        self.mutex_afiliacion = threading.Lock()
         
-        # SECCIÓN CRÍTICA 8: Afiliaciones
-        self.mutex_afiliacion = threading.Semaphore(1)
+        # SECCIÓN CRÍTICA 6: Contador de servicios activos
+        self.mutex_servicios_activos = threading.Lock()
         
-        # Semáforo para esperar fin de servicios activos
-        self.sem_no_hay_servicios_activos = threading.Semaphore(0)
+        # Evento para esperar fin de servicios activos
+        self.event_no_servicios_activos = threading.Event()
         
         # ==================== REPORTES ====================
         self.ganancia_total_empresa = 0.0
         self.reportes_diarios = []
         
-        print(config.MENSAJES["SEPARADOR"])
-        print("SISTEMA UNIETAXI INICIALIZADO")
-        print(config.MENSAJES["SEPARADOR"])
+        logger.info(config.MENSAJES["SEPARADOR"])
+        logger.info("SISTEMA UNIETAXI INICIALIZADO")
+        logger.info(config.MENSAJES["SEPARADOR"])
+    
+    def _reset(self):
+        """
+        Devuelve el sistema al estado recién construido conservando sus locks
+        (reutilización en pruebas). No debe haber hilos usando el sistema.
+        """
+        self.taxis.clear()
+        self.clientes.clear()
+        self.servicios_completados.clear()
+        self.servicios_seguimiento.clear()
+        self.cola_solicitudes = SimpleQueue()
+        self._servicios_exportados.clear()
+        self._cedulas_clientes.clear()
+        self._placas_taxis.clear()
+        
+        self.dia_actual = 1
+        self.servicios_activos = 0
+        self.fin_del_dia = False
+        self.fin_sistema = False
+        self.contador_servicios = itertools.count(1)
+        self.event_no_servicios_activos.clear()
+        
+        self.ganancia_total_empresa = 0.0
+        self.reportes_diarios.clear()
     
     # ==================== AFILIACIÓN ====================
     
-    def afiliar_cliente(self, cedula: int, nombre: str, apellido: str, tarjeta: str) -> bool:
+    def afiliar_cliente(self, cedula: int, nombre: str, apellido: str, tarjeta: str) -> Optional[Cliente]:
         """
         Afilia un nuevo cliente al sistema.
         SECCIÓN CRÍTICA: Protegida por mutex_afiliacion
@@ -99,33 +236,46 @@ class SistemaCentral:
             tarjeta: Número de tarjeta de crédito (16 dígitos)
         
         Returns:
-            True si se afilió correctamente, False en caso contrario
+            El Cliente afiliado, o None si fue rechazado
         """
-        self.mutex_afiliacion.acquire()
-        try:
-            # Validar tarjeta (16 dígitos)
-            tarjeta_limpia = tarjeta.replace(" ", "").replace("-", "")
-            if len(tarjeta_limpia) != config.VALIDACIONES["TARJETA_DIGITOS"] or not tarjeta_limpia.isdigit():
-                print(f"❌ Cliente {nombre} {apellido}: Tarjeta inválida (debe tener {config.VALIDACIONES['TARJETA_DIGITOS']} dígitos)")
-                return False
-            
-            # Verificar que no exista
-            for cliente in self.clientes:
-                if cliente.cedula == cedula:
-                    print(f"❌ Cliente ya registrado: {cedula}")
-                    return False
-            
-            # Crear cliente
-            nuevo_cliente = Cliente(cedula, nombre, apellido, tarjeta_limpia)
-            self.clientes.append(nuevo_cliente)
-            print(f"✅ Cliente afiliado: {nuevo_cliente}")
-            return True
-            
-        finally:
-            self.mutex_afiliacion.release()
+        with self.mutex_afiliacion:
+            return self._registrar_cliente(cedula, nombre, apellido, tarjeta)
+    
+    def afiliar_clientes_bulk(self, registros: List[dict]) -> int:
+        """
+        Afilia varios clientes tomando mutex_afiliacion una sola vez.
+        
+        Args:
+            registros: Diccionarios con los argumentos de afiliar_cliente
+        
+        Returns:
+            Número de clientes afiliados
+        """
+        with self.mutex_afiliacion:
+            return sum(self._registrar_cliente(**registro) is not None for registro in registros)
+    
+    def _registrar_cliente(self, cedula: int, nombre: str, apellido: str, tarjeta: str) -> Optional[Cliente]:
+        """Valida y agrega un cliente. Requiere mutex_afiliacion tomado."""
+        # Validar tarjeta (16 dígitos)
+        tarjeta_limpia = tarjeta.translate(_CARD_STRIP)
+        if not _CARD_RE.fullmatch(tarjeta_limpia):
+            logger.warning("❌ Cliente %s %s: Tarjeta inválida (debe tener %s dígitos)", nombre, apellido, config.VALIDACIONES['TARJETA_DIGITOS'])
+            return None
+        
+        # Verificar que no exista
+        if cedula in self._cedulas_clientes:
+            logger.warning("❌ Cliente ya registrado: %s", cedula)
+            return None
+        
+        # Crear cliente
+        nuevo_cliente = Cliente(cedula, nombre, apellido, tarjeta_limpia)
+        self.clientes.append(nuevo_cliente)
+        self._cedulas_clientes.add(cedula)
+        logger.info("✅ Cliente afiliado: %s", nuevo_cliente)
+        return nuevo_cliente
     
     def afiliar_taxi(self, cedula: int, nombre: str, apellido: str, 
-                     placa: str, marca: str, modelo: str, velocidad: int) -> bool:
+                     placa: str, marca: str, modelo: str, velocidad: int) -> Optional[Taxi]:
         """
         Afilia un nuevo taxi al sistema.
         SECCIÓN CRÍTICA: Protegida por mutex_afiliacion
@@ -140,44 +290,60 @@ class SistemaCentral:
             velocidad: Velocidad promedio en km/h
         
         Returns:
-            True si se afilió correctamente, False en caso contrario
+            El Taxi afiliado, o None si fue rechazado
         """
-        self.mutex_afiliacion.acquire()
-        try:
-            # Validaciones básicas
-            if velocidad <= 0:
-                print(f"❌ Taxi {placa}: Velocidad inválida")
-                return False
-            
-            if len(placa) < config.VALIDACIONES["PLACA_MIN_CHARS"]:
-                print(f"❌ Taxi {placa}: Placa debe tener al menos {config.VALIDACIONES['PLACA_MIN_CHARS']} caracteres")
-                return False
-            
-            # Verificar que no exista
-            for taxi in self.taxis:
-                if taxi.placa == placa:
-                    print(f"❌ Taxi ya registrado: {placa}")
-                    return False
-            
-            # Crear taxi
-            id_taxi = len(self.taxis) + 1
-            nuevo_taxi = Taxi(id_taxi, cedula, nombre, apellido, placa, 
-                            marca, modelo, velocidad)
-            
-            # Ubicación aleatoria inicial (dentro de Madrid)
-            punto_inicio = random.choice(config.PUNTOS_INICIO_TAXIS)
-            nuevo_taxi.ubicacion = (punto_inicio[0], punto_inicio[1])
-            
-            # Asignar color para el mapa
-            if id_taxi - 1 < len(config.COLORES_TAXIS):
-                nuevo_taxi.color_mapa = config.COLORES_TAXIS[id_taxi - 1]["color"]
-            
-            self.taxis.append(nuevo_taxi)
-            print(f"✅ Taxi afiliado: {nuevo_taxi} en posición {nuevo_taxi.ubicacion}")
-            return True
-            
-        finally:
-            self.mutex_afiliacion.release()
+        with self.mutex_afiliacion, self.rw_taxis.write_locked():
+            return self._registrar_taxi(cedula, nombre, apellido, placa,
+                                        marca, modelo, velocidad)
+    
+    def afiliar_taxis_bulk(self, registros: List[dict]) -> int:
+        """
+        Afilia varios taxis tomando mutex_afiliacion y el lock de escritura
+        de rw_taxis una sola vez.
+        
+        Args:
+            registros: Diccionarios con los argumentos de afiliar_taxi
+        
+        Returns:
+            Número de taxis afiliados
+        """
+        with self.mutex_afiliacion, self.rw_taxis.write_locked():
+            return sum(self._registrar_taxi(**registro) is not None for registro in registros)
+    
+    def _registrar_taxi(self, cedula: int, nombre: str, apellido: str,
+                        placa: str, marca: str, modelo: str, velocidad: int) -> Optional[Taxi]:
+        """Valida y agrega un taxi. Requiere mutex_afiliacion y escritura en rw_taxis."""
+        # Validaciones básicas
+        if velocidad <= 0:
+            logger.warning("❌ Taxi %s: Velocidad inválida", placa)
+            return None
+        
+        if len(placa) < config.VALIDACIONES["PLACA_MIN_CHARS"]:
+            logger.warning("❌ Taxi %s: Placa debe tener al menos %s caracteres", placa, config.VALIDACIONES['PLACA_MIN_CHARS'])
+            return None
+        
+        # Verificar que no exista
+        if placa in self._placas_taxis:
+            logger.warning("❌ Taxi ya registrado: %s", placa)
+            return None
+        
+        # Crear taxi
+        id_taxi = len(self.taxis) + 1
+        nuevo_taxi = Taxi(id_taxi, cedula, nombre, apellido, placa, 
+                        marca, modelo, velocidad)
+        
+        # Ubicación aleatoria inicial (dentro de Madrid)
+        punto_inicio = random.choice(config.PUNTOS_INICIO_TAXIS)
+        nuevo_taxi.ubicacion = (punto_inicio[0], punto_inicio[1])
+        
+        # Asignar color para el mapa
+        if id_taxi - 1 < len(config.COLORES_TAXIS):
+            nuevo_taxi.color_mapa = config.COLORES_TAXIS[id_taxi - 1]["color"]
+        
+        self.taxis.append(nuevo_taxi)
+        self._placas_taxis.add(placa)
+        logger.info("✅ Taxi afiliado: %s en posición %s", nuevo_taxi, nuevo_taxi.ubicacion)
+        return nuevo_taxi
     
     # ==================== BÚSQUEDA Y ASIGNACIÓN ====================
     
@@ -192,18 +358,20 @@ class SistemaCentral:
         Returns:
             Distancia en kilómetros
         """
-        return math.sqrt((punto2[0] - punto1[0])**2 + (punto2[1] - punto1[1])**2)
+        return math.dist(punto1, punto2)
     
     def buscar_taxi_cercano(self, origen: tuple) -> Optional[Taxi]:
         """
         Busca el taxi más cercano dentro del radio configurado.
-        SECCIÓN CRÍTICA: Protegida por mutex_match
+        SECCIÓN CRÍTICA: Búsqueda bajo lectura de rw_taxis,
+        asignación protegida por mutex_match
         
         Algoritmo:
         1. Busca taxis disponibles dentro de RADIO_BUSQUEDA_KM
         2. Selecciona el más cercano
         3. Si hay empate, desempata por calificación
-        4. Marca el taxi como ocupado
+        4. Marca el taxi como ocupado (si otro cliente lo tomó entre
+           la búsqueda y la asignación, vuelve a buscar)
         
         Args:
             origen: Coordenadas (lat, lng) del cliente
@@ -211,36 +379,56 @@ class SistemaCentral:
         Returns:
             Taxi asignado o None si no hay disponibles
         """
-        self.mutex_match.acquire()
-        try:
-            taxi_elegido = None
-            distancia_minima = config.TAXI_CONFIG["RADIO_BUSQUEDA_KM"]
-            
-            self.mutex_taxis.acquire()
-            try:
-                for taxi in self.taxis:
-                    if taxi.disponible and taxi.estado == "activo":
-                        distancia = self.calcular_distancia(origen, taxi.ubicacion)
-                        
-                        if distancia < distancia_minima:
-                            distancia_minima = distancia
-                            taxi_elegido = taxi
-                        elif distancia == distancia_minima and taxi_elegido:
-                            # Desempate por calificación
-                            if taxi.calcular_calificacion_promedio() > taxi_elegido.calcular_calificacion_promedio():
-                                taxi_elegido = taxi
-                
-                # Marcar taxi como ocupado
-                if taxi_elegido:
-                    taxi_elegido.disponible = False
-                    
-            finally:
-                self.mutex_taxis.release()
+        origen_lat, origen_lng = origen
+        
+        while True:
+            with self.rw_taxis.read_locked():
+                taxi_elegido = self._elegir_taxi(self.taxis, origen_lat, origen_lng)
             
-            return taxi_elegido
+            if taxi_elegido is None:
+                return None
             
-        finally:
-            self.mutex_match.release()
+            # Marcar taxi como ocupado solo si sigue disponible
+            with self.mutex_match:
+                if taxi_elegido.disponible:
+                    taxi_elegido.disponible = False
+                    return taxi_elegido
+    
+    @staticmethod
+    def _elegir_taxi(taxis: List[Taxi], origen_lat: float, origen_lng: float) -> Optional[Taxi]:
+        """Elige el taxi disponible más cercano dentro del radio (desempate por calificación)"""
+        taxi_elegido = None
+        calificacion_elegido = None  # Se calcula solo si hay empate
+        # Se comparan distancias al cuadrado (sqrt es monótona)
+        distancia_minima_sq = _RADIO_BUSQUEDA_SQ
+        
+        for taxi in taxis:
+            if taxi.disponible and taxi.estado == "activo":
+                # Distancia calculada en línea (sin llamada por taxi)
+                lat, lng = taxi.ubicacion
+                dx = lat - origen_lat
+                dy = lng - origen_lng
+                distancia_sq = dx*dx + dy*dy
+                
+                if distancia_sq < distancia_minima_sq:
+                    distancia_minima_sq = distancia_sq
+                    taxi_elegido = taxi
+                    calificacion_elegido = None
+                elif distancia_sq == distancia_minima_sq and taxi_elegido:
+                    # Desempate por calificación
+                    if calificacion_elegido is None:
+                        calificacion_elegido = taxi_elegido.calcular_calificacion_promedio()
+                    calificacion = taxi.calcular_calificacion_promedio()
+                    if calificacion > calificacion_elegido:
+                        taxi_elegido = taxi
+                        calificacion_elegido = calificacion
+        
+        return taxi_elegido
+    
+    def _liberar_taxi(self, taxi: Taxi):
+        """Devuelve a disponible un taxi reservado por buscar_taxi_cercano"""
+        taxi.cliente_actual = None
+        taxi.disponible = True
     
     def asignar_taxi(self, cliente: Cliente) -> Optional[Taxi]:
         """
@@ -258,14 +446,14 @@ class SistemaCentral:
             cliente.taxi_asignado = taxi.id_taxi
             taxi.cliente_actual = cliente.cedula
             
-            distancia = self.calcular_distancia(taxi.ubicacion, cliente.ubicacion_actual)
+            distancia = math.dist(taxi.ubicacion, cliente.ubicacion_actual)
             tiempo_llegada = (distancia / taxi.velocidad) * 60  # minutos
             
-            print(f"🚖 MATCH: {cliente} ← {taxi}")
-            print(f"   Distancia: {distancia:.2f} km | Tiempo llegada: {tiempo_llegada:.1f} min")
+            logger.info("🚖 MATCH: %s ← %s", cliente, taxi)
+            logger.info("   Distancia: %.2f km | Tiempo llegada: %.1f min", distancia, tiempo_llegada)
             return taxi
         else:
-            print(f"❌ No hay taxis disponibles para {cliente}")
+            logger.info("❌ No hay taxis disponibles para %s", cliente)
             return None
     
     # ==================== GESTIÓN DE SERVICIOS ====================
@@ -273,36 +461,36 @@ class SistemaCentral:
     def activar_servicio(self) -> bool:
         """
         Incrementa el contador de servicios activos.
-        SECCIÓN CRÍTICA: Protegida por mutex_fin_del_dia
+        SECCIÓN CRÍTICA: Protegida por mutex_servicios_activos
         
         Returns:
             True si se puede activar, False si ya es fin del día
         """
-        self.mutex_fin_del_dia.acquire()
-        try:
-            if not self.fin_del_dia:
-                self.servicios_activos += 1
-            return not self.fin_del_dia
-        finally:
-            self.mutex_fin_del_dia.release()
+        # Lectura sin lock: rechazo rápido una vez cerrado el día
+        if self.fin_del_dia:
+            return False
+        
+        # finalizar_dia marca fin_del_dia con este lock tomado, así que la
+        # segunda lectura no puede colarse detrás del cierre
+        with self.mutex_servicios_activos:
+            if self.fin_del_dia:
+                return False
+            self.servicios_activos += 1
+            return True
     
     def desactivar_servicio(self):
         """
         Decrementa el contador de servicios activos.
-        SECCIÓN CRÍTICA: Protegida por mutex_fin_del_dia
+        SECCIÓN CRÍTICA: Protegida por mutex_servicios_activos
         
         Si no hay servicios activos y es fin de día, señala al sistema principal.
         """
-        self.mutex_fin_del_dia.acquire()
-        try:
+        with self.mutex_servicios_activos:
             self.servicios_activos -= 1
             
             # Si no hay servicios activos y es fin de día, señalar al sistema
             if self.servicios_activos == 0 and self.fin_del_dia:
-                self.sem_no_hay_servicios_activos.release()
-                
-        finally:
-            self.mutex_fin_del_dia.release()
+                self.event_no_servicios_activos.set()
     
     def realizar_servicio(self, cliente: Cliente, taxi: Taxi):
         """
@@ -313,8 +501,9 @@ class SistemaCentral:
         2. Simula el traslado
         3. Cliente califica
         4. Actualiza estadísticas del taxi
-        5. Registra el servicio
-        6. Libera recursos
+        5. Libera el taxi (queda disponible para otro cliente)
+        6. Registra el servicio
+        7. Libera al cliente
         
         Args:
             cliente: Cliente del servicio
@@ -322,20 +511,18 @@ class SistemaCentral:
         """
         
         # Calcular costo del servicio
-        distancia_km = self.calcular_distancia(cliente.ubicacion_actual, cliente.destino)
+        distancia_km = math.dist(cliente.ubicacion_actual, cliente.destino)
         # Convertir a metros
         distancia_m = distancia_km * 1000.0
-        tarifa_metro = config.TAXI_CONFIG.get("TARIFA_POR_METRO")
-        if tarifa_metro is not None:
+        if _TARIFA_METRO is not None:
             # Cobrar por metro (prioridad si está configurado)
-            costo = distancia_m * tarifa_metro
+            costo = distancia_m * _TARIFA_METRO
         else:
-            costo = distancia_km * config.TAXI_CONFIG["TARIFA_POR_KM"]
+            costo = distancia_km * _TARIFA_KM
         
         # Crear registro de servicio
-        self.contador_servicios += 1
         servicio = Servicio(
-            id_servicio=self.contador_servicios,
+            id_servicio=next(self.contador_servicios),
             id_taxi=taxi.id_taxi,
             id_cliente=cliente.cedula,
             origen=cliente.ubicacion_actual,
@@ -345,11 +532,18 @@ class SistemaCentral:
             dia=self.dia_actual
         )
         
-        print(f"\n🚗 INICIO SERVICIO #{servicio.id_servicio}")
-        print(f"   Cliente: {cliente}")
-        print(f"   Taxi: {taxi}")
-        print(f"   Ruta: {servicio.origen} → {servicio.destino}")
-        print(f"   Distancia: {distancia_km:.2f} km | Costo: ${costo:.2f}")
+        # Un solo registro por bloque: las líneas del servicio salen juntas
+        # aunque otros hilos escriban a la vez. Argumentos perezosos: con
+        # NIVEL = "WARNING" no se formatea nada
+        logger.info(
+            "\n🚗 INICIO SERVICIO #%s\n"
+            "   Cliente: %s\n"
+            "   Taxi: %s\n"
+            "   Ruta: %s → %s\n"
+            "   Distancia: %.2f km | Costo: $%.2f",
+            servicio.id_servicio, cliente, taxi, servicio.origen, servicio.destino,
+            distancia_km, costo
+        )
         
         # Simular traslado
         tiempo_viaje = (distancia_km / taxi.velocidad) * 3600  # segundos
@@ -367,30 +561,29 @@ class SistemaCentral:
         taxi.agregar_calificacion(calificacion)
         taxi.agregar_ganancia(costo)
         
-        print(f"✅ SERVICIO COMPLETADO")
-        print(f"   Calificación: {calificacion}⭐ | Promedio taxi: {taxi.calcular_calificacion_promedio():.2f}⭐")
+        # Liberar el taxi antes de registrar: el registro toma locks
+        # compartidos y el taxi ya puede atender otra solicitud
+        self._liberar_taxi(taxi)
+        
+        # El promedio se calcula solo si el registro se va a emitir
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✅ SERVICIO COMPLETADO\n"
+                "   Calificación: %s⭐ | Promedio taxi: %.2f⭐",
+                calificacion, taxi.calcular_calificacion_promedio()
+            )
         
         # Registrar servicio
-        self.mutex_servicios_completados.acquire()
-        try:
+        with self.mutex_servicios:
             self.servicios_completados.append(servicio)
             
             # Agregar a seguimiento (primeros N del día)
-            self.mutex_servicios_seguimiento.acquire()
-            try:
-                if len(self.servicios_seguimiento) < config.SEGUIMIENTO["SERVICIOS_POR_DIA"]:
-                    servicio.en_seguimiento = True
-                    self.servicios_seguimiento.append(servicio)
-                    print(f"📊 Servicio agregado a seguimiento diario ({len(self.servicios_seguimiento)}/{config.SEGUIMIENTO['SERVICIOS_POR_DIA']})")
-            finally:
-                self.mutex_servicios_seguimiento.release()
-                
-        finally:
-            self.mutex_servicios_completados.release()
+            if len(self.servicios_seguimiento) < _SERVICIOS_SEGUIMIENTO:
+                servicio.en_seguimiento = True
+                self.servicios_seguimiento.append(servicio)
+                logger.info("📊 Servicio agregado a seguimiento diario (%s/%s)", len(self.servicios_seguimiento), _SERVICIOS_SEGUIMIENTO)
         
-        # Liberar recursos
-        taxi.disponible = True
-        taxi.cliente_actual = None
+        # Liberar cliente
         cliente.taxi_asignado = None
         cliente.en_servicio = False
     
@@ -401,134 +594,128 @@ class SistemaCentral:
         Genera el reporte diario de servicios en seguimiento.
         SECCIÓN CRÍTICA: Debe esperar a que no haya servicios activos
         """
-        print(f"\n{config.MENSAJES['SEPARADOR']}")
-        print(f"📋 REPORTE DÍA {self.dia_actual}")
-        print(f"{config.MENSAJES['SEPARADOR']}")
+        logger.info("\n%s", config.MENSAJES['SEPARADOR'])
+        logger.info("📋 REPORTE DÍA %s", self.dia_actual)
+        logger.info(config.MENSAJES["SEPARADOR"])
         
         ganancia_dia = 0.0
         
-        if len(self.servicios_seguimiento) > 0:
-            print(f"\n🔍 SERVICIOS EN SEGUIMIENTO:")
-            for i, servicio in enumerate(self.servicios_seguimiento, 1):
-                print(f"\n{i}. Servicio #{servicio.id_servicio}")
-                print(f"   Taxi: {servicio.id_taxi} | Cliente: {servicio.id_cliente}")
-                print(f"   Origen: ({servicio.origen[0]:.4f}, {servicio.origen[1]:.4f})")
-                print(f"   Destino: ({servicio.destino[0]:.4f}, {servicio.destino[1]:.4f})")
-                print(f"   Distancia: {servicio.distancia_km:.2f} km | Costo: ${servicio.costo:.2f}")
-                print(f"   Calificación: {servicio.calificacion}⭐ | Hora: {servicio.timestamp}")
+        # Tomar y limpiar los servicios de seguimiento en la misma sección crítica
+        with self.mutex_servicios:
+            seguimiento = list(self.servicios_seguimiento)
+            self.servicios_seguimiento.clear()
+        
+        if len(seguimiento) > 0:
+            logger.info("\n🔍 SERVICIOS EN SEGUIMIENTO:")
+            for i, servicio in enumerate(seguimiento, 1):
+                logger.info("\n%s. Servicio #%s", i, servicio.id_servicio)
+                logger.info("   Taxi: %s | Cliente: %s", servicio.id_taxi, servicio.id_cliente)
+                logger.info("   Origen: (%.4f, %.4f)", servicio.origen[0], servicio.origen[1])
+                logger.info("   Destino: (%.4f, %.4f)", servicio.destino[0], servicio.destino[1])
+                logger.info("   Distancia: %.2f km | Costo: $%.2f", servicio.distancia_km, servicio.costo)
+                logger.info("   Calificación: %s⭐ | Hora: %s", servicio.calificacion, servicio.timestamp)
                 ganancia_dia += servicio.costo
         else:
-            print("No hubo servicios en seguimiento hoy")
+            logger.info("No hubo servicios en seguimiento hoy")
         
-        print(f"\n💰 Ganancia total del día: ${ganancia_dia:.2f}")
-        print(f"{config.MENSAJES['SEPARADOR']}\n")
+        logger.info("\n💰 Ganancia total del día: $%.2f", ganancia_dia)
+        logger.info("%s\n", config.MENSAJES['SEPARADOR'])
         
         # Guardar reporte
         self.reportes_diarios.append({
             'dia': self.dia_actual,
-            'servicios': [s.to_dict() for s in self.servicios_seguimiento],
+            'servicios': [s.to_dict() for s in seguimiento],
             'ganancia': ganancia_dia
         })
-        
-        # Limpiar servicios de seguimiento para el próximo día
-        self.servicios_seguimiento.clear()
     
     def cierre_contable_diario(self):
         """
         Realiza el cierre contable del día.
         Descuenta 20% a cada taxista y transfiere el monto.
         """
-        print(f"\n{config.MENSAJES['SEPARADOR']}")
-        print(f"💼 CIERRE CONTABLE - DÍA {self.dia_actual} (12:00 PM)")
-        print(f"{config.MENSAJES['SEPARADOR']}\n")
+        logger.info("\n%s", config.MENSAJES['SEPARADOR'])
+        logger.info("💼 CIERRE CONTABLE - DÍA %s (12:00 PM)", self.dia_actual)
+        logger.info("%s\n", config.MENSAJES['SEPARADOR'])
         
         ganancia_empresa_dia = 0.0
         
-        self.mutex_taxis.acquire()
-        try:
+        with self.rw_taxis.write_locked():
             for taxi in self.taxis:
                 if taxi.ganancia_diaria > 0:
-                    descuento_empresa = taxi.ganancia_diaria * config.TAXI_CONFIG["COMISION_EMPRESA"]
-                    ganancia_taxista = taxi.ganancia_diaria * (1 - config.TAXI_CONFIG["COMISION_EMPRESA"])
+                    descuento_empresa = taxi.ganancia_diaria * _COMISION
+                    ganancia_taxista = taxi.ganancia_diaria - descuento_empresa
                     ganancia_empresa_dia += descuento_empresa
                     
-                    print(f"🚖 {taxi}")
-                    print(f"   Total generado: ${taxi.ganancia_diaria:.2f}")
-                    print(f"   Comisión UNIETAXI ({int(config.TAXI_CONFIG['COMISION_EMPRESA']*100)}%): ${descuento_empresa:.2f}")
-                    print(f"   Ganancia taxista ({int((1-config.TAXI_CONFIG['COMISION_EMPRESA'])*100)}%): ${ganancia_taxista:.2f}\n")
+                    logger.info("🚖 %s", taxi)
+                    logger.info("   Total generado: $%.2f", taxi.ganancia_diaria)
+                    logger.info("   Comisión UNIETAXI (%s%%): $%.2f", _PCT_COMISION, descuento_empresa)
+                    logger.info("   Ganancia taxista (%s%%): $%.2f\n", _PCT_TAXISTA, ganancia_taxista)
                     
                     # Resetear ganancia diaria
                     taxi.resetear_ganancia_diaria()
             
             self.ganancia_total_empresa += ganancia_empresa_dia
-            
-        finally:
-            self.mutex_taxis.release()
         
-        print(f"💰 Ganancia empresa del día: ${ganancia_empresa_dia:.2f}")
-        print(f"💰 Ganancia acumulada empresa: ${self.ganancia_total_empresa:.2f}")
-        print(f"{config.MENSAJES['SEPARADOR']}\n")
+        logger.info("💰 Ganancia empresa del día: $%.2f", ganancia_empresa_dia)
+        logger.info("💰 Ganancia acumulada empresa: $%.2f", self.ganancia_total_empresa)
+        logger.info("%s\n", config.MENSAJES['SEPARADOR'])
     
     def generar_reporte_mensual(self):
         """Genera el reporte mensual final con estadísticas completas"""
-        print(f"\n{config.MENSAJES['SEPARADOR']}")
-        print(f"📊 REPORTE MENSUAL FINAL")
-        print(f"{config.MENSAJES['SEPARADOR']}\n")
+        # El reporte solo registra: sin nivel INFO no hay nada que calcular
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        self.mutex_taxis.acquire()
-        try:
+        logger.info("\n%s", config.MENSAJES['SEPARADOR'])
+        logger.info("📊 REPORTE MENSUAL FINAL")
+        logger.info("%s\n", config.MENSAJES['SEPARADOR'])
+        
+        with self.rw_taxis.read_locked():
             for taxi in self.taxis:
                 if taxi.cantidad_servicios > 0:
                     descuento_total = taxi.calcular_comision_empresa()
                     ganancia_final = taxi.calcular_ganancia_neta()
                     
-                    print(f"ID Taxista: {taxi.id_taxi} :: Nombre: {taxi.nombre_completo()}")
-                    print(f"Placa: {taxi.placa} :: Marca: {taxi.marca} :: Modelo: {taxi.modelo}")
-                    print(f"Total Generado: ${taxi.ganancia_total:.2f}")
-                    print(f"Importe Mensual ({int(config.TAXI_CONFIG['COMISION_EMPRESA']*100)}%): ${descuento_total:.2f}")
-                    print(f"Ganancia del taxista ({int((1-config.TAXI_CONFIG['COMISION_EMPRESA'])*100)}%): ${ganancia_final:.2f}")
-                    print(f"Servicios realizados: {taxi.cantidad_servicios}")
-                    print(f"Calificación promedio: {taxi.calcular_calificacion_promedio():.2f}⭐")
-                    print(f"{config.MENSAJES['SEPARADOR_MENOR']}\n")
-                    
-        finally:
-            self.mutex_taxis.release()
-        
-        print(f"💰 GANANCIA TOTAL EMPRESA: ${self.ganancia_total_empresa:.2f}")
-        print(f"📈 Total servicios realizados: {len(self.servicios_completados)}")
-        print(f"📊 Total clientes atendidos: {len(set(s.id_cliente for s in self.servicios_completados))}")
-        print(f"🚖 Total taxis activos: {len([t for t in self.taxis if t.cantidad_servicios > 0])}")
-        print(f"{config.MENSAJES['SEPARADOR']}\n")
+                    logger.info("ID Taxista: %s :: Nombre: %s", taxi.id_taxi, taxi.nombre_completo())
+                    logger.info("Placa: %s :: Marca: %s :: Modelo: %s", taxi.placa, taxi.marca, taxi.modelo)
+                    logger.info("Total Generado: $%.2f", taxi.ganancia_total)
+                    logger.info("Importe Mensual (%s%%): $%.2f", _PCT_COMISION, descuento_total)
+                    logger.info("Ganancia del taxista (%s%%): $%.2f", _PCT_TAXISTA, ganancia_final)
+                    logger.info("Servicios realizados: %s", taxi.cantidad_servicios)
+                    logger.info("Calificación promedio: %.2f⭐", taxi.calcular_calificacion_promedio())
+                    logger.info("%s\n", config.MENSAJES['SEPARADOR_MENOR'])
+        
+        logger.info("💰 GANANCIA TOTAL EMPRESA: $%.2f", self.ganancia_total_empresa)
+        logger.info("📈 Total servicios realizados: %s", len(self.servicios_completados))
+        logger.info("📊 Total clientes atendidos: %s", len(set(s.id_cliente for s in self.servicios_completados)))
+        logger.info("🚖 Total taxis activos: %s", len([t for t in self.taxis if t.cantidad_servicios > 0]))
+        logger.info("%s\n", config.MENSAJES['SEPARADOR'])
     
     # ==================== CONTROL DE DÍAS ====================
     
     def iniciar_nuevo_dia(self):
         """Inicia un nuevo día en el sistema"""
-        print(f"\n\n{'#'*60}")
-        print(f"🌅 INICIO DÍA {self.dia_actual} - {config.obtener_fecha_legible()}")
-        print(f"{'#'*60}\n")
+        logger.info("\n\n%s", '#'*60)
+        logger.info("🌅 INICIO DÍA %s - %s", self.dia_actual, config.obtener_fecha_legible())
+        logger.info("%s\n", '#'*60)
         
-        self.mutex_fin_del_dia.acquire()
-        try:
+        with self.mutex_fin_del_dia:
             self.fin_del_dia = False
-        finally:
-            self.mutex_fin_del_dia.release()
     
     def finalizar_dia(self):
         """Finaliza el día actual"""
-        print(f"\n🌙 Finalizando día {self.dia_actual}...")
+        logger.info("\n🌙 Finalizando día %s...", self.dia_actual)
         
-        # Marcar fin del día
-        self.mutex_fin_del_dia.acquire()
-        try:
+        # Marcar fin del día (el evento se limpia antes de que alguien lo señale)
+        with self.mutex_fin_del_dia, self.mutex_servicios_activos:
+            self.event_no_servicios_activos.clear()
             self.fin_del_dia = True
-        finally:
-            self.mutex_fin_del_dia.release()
+            pendientes = self.servicios_activos
         
         # Esperar a que terminen todos los servicios activos
-        if self.servicios_activos > 0:
-            print(f"⏳ Esperando finalización de {self.servicios_activos} servicios activos...")
-            self.sem_no_hay_servicios_activos.acquire()
+        if pendientes > 0:
+            logger.info("⏳ Esperando finalización de %s servicios activos...", pendientes)
+            self.event_no_servicios_activos.wait()
         
         # Generar reportes
         self.generar_reporte_diario()
@@ -542,25 +729,69 @@ class SistemaCentral:
     def exportar_datos_json(self):
         """Exporta todos los datos del sistema a archivos JSON"""
         
-        # Exportar servicios completados
-        with open(config.SERVICIOS_JSON, 'w', encoding='utf-8') as f:
-            servicios_data = [s.to_dict() for s in self.servicios_completados]
-            json.dump(servicios_data, f, indent=2, ensure_ascii=False)
+        # Exportar servicios completados (solo se convierten los nuevos)
+        with self.mutex_servicios:
+            nuevos = self.servicios_completados[len(self._servicios_exportados):]
+            self._servicios_exportados.extend(s.to_dict() for s in nuevos)
+            servicios_data = list(self._servicios_exportados)
+        _escribir_json_atomico(config.SERVICIOS_JSON, servicios_data)
         
         # Exportar ubicaciones en tiempo real para el mapa
+        # (instantáneas bajo lock; la escritura a disco va fuera del lock)
+        with self.rw_taxis.read_locked():
+            taxis_data = [t.to_dict() for t in self.taxis]
+        with self.mutex_afiliacion:
+            clientes_data = [c.to_dict() for c in self.clientes if c.en_servicio]
         ubicaciones = {
-            "taxis": [t.to_dict() for t in self.taxis],
-            "clientes": [c.to_dict() for c in self.clientes if c.en_servicio],
+            "taxis": taxis_data,
+            "clientes": clientes_data,
             "timestamp": config.obtener_fecha_legible()
         }
-        with open(config.UBICACIONES_TIEMPO_REAL, 'w', encoding='utf-8') as f:
-            json.dump(ubicaciones, f, indent=2, ensure_ascii=False)
+        _escribir_json_atomico(config.UBICACIONES_TIEMPO_REAL, ubicaciones)
         
-        print(f"✅ Datos exportados a JSON")
+        logger.info("✅ Datos exportados a JSON")
 
 
 # ==================== FUNCIONES AUXILIARES ====================
 
+# os.umask solo se puede leer cambiándolo: se consulta una vez al importar
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _escribir_json_atomico(ruta: str, datos) -> None:
+    """
+    Escribe `datos` como JSON en un archivo temporal y lo renombra sobre `ruta`,
+    de modo que los lectores nunca ven un JSON a medio escribir.
+    """
+    # Temporal único en el mismo directorio: os.replace solo es atómico
+    # dentro del mismo sistema de archivos y dos escritores no se pisan
+    f = tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.tmp',
+                                    dir=os.path.dirname(ruta) or '.',
+                                    delete=False)
+    try:
+        with f:
+            json.dump(datos, f, indent=2, ensure_ascii=False)
+        # NamedTemporaryFile crea el archivo con 0600: se conservan los
+        # permisos del JSON existente o los de un open() normal
+        try:
+            modo = stat.S_IMODE(os.stat(ruta).st_mode)
+        except FileNotFoundError:
+            modo = 0o666 & ~_UMASK
+        os.chmod(f.name, modo)
+        os.replace(f.name, ruta)
+    except BaseException:
+        # No dejar temporales huérfanos junto al JSON
+        os.unlink(f.name)
+        raise
+
+
+def _separar_nombre(nombre_completo: str) -> tuple:
+    """Separa "Nombre Apellidos" en (nombre, apellido)"""
+    partes_nombre = nombre_completo.split(maxsplit=1)
+    return partes_nombre[0], partes_nombre[1] if len(partes_nombre) > 1 else ""
+
+
 def cargar_clientes_desde_json(sistema: SistemaCentral) -> int:
     """
     Carga clientes desde el archivo JSON de registro_unificado.py
@@ -568,38 +799,40 @@ def cargar_clientes_desde_json(sistema: SistemaCentral) -> int:
     Returns:
         Número de clientes cargados
     """
+    registros = []
     try:
         with open(config.CLIENTES_JSON, "r", encoding="utf-8") as f:
             clientes_data = json.load(f)
         
-        contador = 0
         for cliente_data in clientes_data:
             if cliente_data.get("estado") == "activo":
-                # Generar ID numérico desde la identificación
-                cedula_numerica = abs(hash(cliente_data["identificacion"])) % 10**8
-                
-                # Separar nombre y apellido
-                partes_nombre = cliente_data["nombre"].split(maxsplit=1)
-                nombre = partes_nombre[0]
-                apellido = partes_nombre[1] if len(partes_nombre) > 1 else ""
-                
-                if sistema.afiliar_cliente(
-                    cedula=cedula_numerica,
-                    nombre=nombre,
-                    apellido=apellido,
-                    tarjeta=cliente_data["tarjeta"]
-                ):
-                    contador += 1
-        
-        print(f"✅ Cargados {contador} clientes desde JSON\n")
-        return contador
+                nombre, apellido = _separar_nombre(cliente_data["nombre"])
+                registros.append({
+                    # Generar ID numérico desde la identificación
+                    "cedula": abs(hash(cliente_data["identificacion"])) % 10**8,
+                    "nombre": nombre,
+                    "apellido": apellido,
+                    "tarjeta": cliente_data["tarjeta"],
+                })
         
     except FileNotFoundError:
-        print(f"⚠️ No se encontró {config.CLIENTES_JSON}")
+        logger.warning("⚠️ No se encontró %s", config.CLIENTES_JSON)
         return 0
     except Exception as e:
-        print(f"❌ Error cargando clientes: {e}")
-        return 0
+        # Los clientes leídos antes del registro erróneo se afilian igualmente
+        logger.error("❌ Error cargando clientes: %s", e)
+    
+    # Si un registro con tipos inválidos interrumpe el alta, los anteriores
+    # ya quedaron afiliados: el conteo sale de la lista y no del retorno
+    afiliados_antes = len(sistema.clientes)
+    try:
+        sistema.afiliar_clientes_bulk(registros)
+    except (TypeError, AttributeError, ValueError) as e:
+        logger.error("❌ Error cargando clientes: %s", e)
+    contador = len(sistema.clientes) - afiliados_antes
+    
+    logger.info("✅ Cargados %s clientes desde JSON\n", contador)
+    return contador
 
 
 def cargar_taxis_desde_json(sistema: SistemaCentral) -> int:
@@ -609,41 +842,43 @@ def cargar_taxis_desde_json(sistema: SistemaCentral) -> int:
     Returns:
         Número de taxis cargados
     """
+    registros = []
     try:
         with open(config.TAXIS_JSON, "r", encoding="utf-8") as f:
             taxis_data = json.load(f)
         
-        contador = 0
         for taxi_data in taxis_data:
             if taxi_data.get("estado") == "activo":
-                # Generar ID numérico desde la identificación
-                cedula_numerica = abs(hash(taxi_data["identificacion"])) % 10**8
-                
-                # Separar nombre y apellido
-                partes_nombre = taxi_data["nombre"].split(maxsplit=1)
-                nombre = partes_nombre[0]
-                apellido = partes_nombre[1] if len(partes_nombre) > 1 else ""
-                
-                if sistema.afiliar_taxi(
-                    cedula=cedula_numerica,
-                    nombre=nombre,
-                    apellido=apellido,
-                    placa=taxi_data["placa"],
-                    marca="Toyota",  # Valor por defecto
-                    modelo="Corolla",
-                    velocidad=config.TAXI_CONFIG["VELOCIDAD_PROMEDIO_KMH"]
-                ):
-                    contador += 1
-        
-        print(f"✅ Cargados {contador} taxis desde JSON\n")
-        return contador
+                nombre, apellido = _separar_nombre(taxi_data["nombre"])
+                registros.append({
+                    # Generar ID numérico desde la identificación
+                    "cedula": abs(hash(taxi_data["identificacion"])) % 10**8,
+                    "nombre": nombre,
+                    "apellido": apellido,
+                    "placa": taxi_data["placa"],
+                    "marca": "Toyota",  # Valor por defecto
+                    "modelo": "Corolla",
+                    "velocidad": config.TAXI_CONFIG["VELOCIDAD_PROMEDIO_KMH"],
+                })
         
     except FileNotFoundError:
-        print(f"⚠️ No se encontró {config.TAXIS_JSON}")
+        logger.warning("⚠️ No se encontró %s", config.TAXIS_JSON)
         return 0
     except Exception as e:
-        print(f"❌ Error cargando taxis: {e}")
-        return 0
+        # Los taxis leídos antes del registro erróneo se afilian igualmente
+        logger.error("❌ Error cargando taxis: %s", e)
+    
+    # Si un registro con tipos inválidos interrumpe el alta, los anteriores
+    # ya quedaron afiliados: el conteo sale de la lista y no del retorno
+    afiliados_antes = len(sistema.taxis)
+    try:
+        sistema.afiliar_taxis_bulk(registros)
+    except (TypeError, AttributeError, ValueError) as e:
+        logger.error("❌ Error cargando taxis: %s", e)
+    contador = len(sistema.taxis) - afiliados_antes
+    
+    logger.info("✅ Cargados %s taxis desde JSON\n", contador)
+    return contador
 
 
 if __name__ == "__main__":
@@ -11,9 +11,19 @@ Ejecuta pruebas de:
 
 import unittest
 import threading
+import io
 import time
 import sys
 import os
+import copy
+import math
+import random
+import logging
+import cProfile
+import pstats
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from queue import SimpleQueue, Empty
 
 # Agregar el directorio raíz al path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -24,117 +34,303 @@ from sistema_central import SistemaCentral
 from hilos import hilo_cliente
 
 
+# ==================== SALIDA ====================
+# UNIETAXI_QUIET=1 silencia los banners de las pruebas y la traza INFO del sistema
+
+_BANNER = "\n" + "=" * 60
+_BANNER_END = "=" * 60
+
+_QUIET = os.environ.get("UNIETAXI_QUIET") == "1"
+_p = (lambda *args, **kwargs: None) if _QUIET else print
+
+if _QUIET:
+    logging.getLogger("unietaxi").setLevel(logging.WARNING)
+
+# UNIETAXI_STRESS=1 activa las pruebas de estrés con muchos hilos
+# (se lanzan a mano antes de entregar; ver "Modo 4" en el README)
+RUN_STRESS = os.environ.get("UNIETAXI_STRESS") == "1"
+
+
+# ==================== POOL DE HILOS COMPARTIDO ====================
+# Los hilos se crean una vez por módulo y se reutilizan en todas las pruebas
+
+_MAX_HILOS = 16
+_ITERACIONES_CARRERA = 5  # Solicitudes por hilo en CP-SC-01
+_POOL: ThreadPoolExecutor = None
+
+
+def setUpModule():
+    global _POOL
+    _POOL = ThreadPoolExecutor(max_workers=_MAX_HILOS)
+
+
+def tearDownModule():
+    # Con hilos bloqueados (sistema descartado) no se espera a que terminen
+    _POOL.shutdown(wait=not _SISTEMAS_DESCARTADOS, cancel_futures=True)
+
+
+def _ejecutar_concurrente(sistema: SistemaCentral, clientes, num_solicitudes: int = 1,
+                          timeout: float = None):
+    """
+    Lanza hilo_cliente para cada cliente en el pool y espera a que terminen.
+    Una barrera retiene a los hilos hasta que todos están listos, de modo que
+    las solicitudes llegan a la vez a las secciones críticas.
+    
+    Con `timeout`, si alguna tarea no termina a tiempo la prueba falla: las
+    que aún no empezaron se cancelan y a las que ya estaban en curso se les
+    concede otro `timeout` como máximo. El sistema de una tarea en curso
+    (posible deadlock) se descarta y no vuelve al pool de sistemas.
+    
+    Las excepciones de los hilos (p. ej. BrokenBarrierError) se relanzan.
+    """
+    if len(clientes) > _MAX_HILOS:
+        raise ValueError(f"La barrera necesita un hilo por cliente (máximo {_MAX_HILOS})")
+    
+    barrera = threading.Barrier(len(clientes))
+    
+    def cliente_sincronizado(cliente):
+        barrera.wait(timeout)
+        hilo_cliente(sistema, cliente, num_solicitudes)
+    
+    futures = [_POOL.submit(cliente_sincronizado, cliente) for cliente in clientes]
+    _, pendientes = wait(futures, timeout=timeout)
+    if pendientes:
+        en_curso = [future for future in pendientes if not future.cancel()]
+        if en_curso:
+            # Puede seguir modificándose: no se reutiliza en otras pruebas
+            _descartar_sistema(sistema)
+            _, colgadas = wait(en_curso, timeout=timeout)
+        else:
+            colgadas = ()
+        raise AssertionError(
+            f"{len(pendientes)} solicitudes no terminaron en {timeout}s "
+            f"({len(colgadas)} hilos siguen bloqueados)"
+        )
+    
+    for future in futures:
+        future.result()  # Relanza la excepción del hilo, si la hubo
+
+
+# ==================== PLANTILLAS DE FIXTURES ====================
+# SistemaCentral contiene locks y no se puede copiar con deepcopy; la
+# plantilla se afilia una vez y cada prueba recibe copias de sus entidades
+
+def _registros_taxis(cantidad: int, base_cedula: int, prefijo_placa: str,
+                     marca: str = "Toyota", modelo: str = "Corolla") -> list:
+    """Registros para afiliar_taxis_bulk: cédulas y placas consecutivas"""
+    return [
+        {"cedula": base_cedula + i, "nombre": f"Taxi{i}", "apellido": "Driver",
+         "placa": f"{prefijo_placa}{i:03d}", "marca": marca, "modelo": modelo,
+         "velocidad": 60}
+        for i in range(cantidad)
+    ]
+
+
+def _registros_clientes(cantidad: int, base_cedula: int) -> list:
+    """Registros para afiliar_clientes_bulk: cédulas consecutivas"""
+    return [
+        {"cedula": base_cedula + i, "nombre": f"Cliente{i}", "apellido": "Test",
+         "tarjeta": "4532123456789012"}
+        for i in range(cantidad)
+    ]
+
+
+def _crear_plantilla(num_taxis: int, num_clientes: int, prefijo_placa: str,
+                     base_taxi: int, base_cliente: int,
+                     marca: str = "Toyota", modelo: str = "Corolla") -> SistemaCentral:
+    """Afilia `num_taxis` taxis y `num_clientes` clientes en un sistema plantilla"""
+    plantilla = SistemaCentral(num_dias=1)
+    plantilla.afiliar_taxis_bulk(
+        _registros_taxis(num_taxis, base_taxi, prefijo_placa, marca=marca, modelo=modelo)
+    )
+    plantilla.afiliar_clientes_bulk(_registros_clientes(num_clientes, base_cliente))
+    return plantilla
+
+
+def _cargar_plantilla(sistema: SistemaCentral, plantilla: SistemaCentral):
+    """Carga en `sistema` copias profundas de los taxis y clientes de la plantilla"""
+    sistema.taxis = copy.deepcopy(plantilla.taxis)
+    sistema.clientes = copy.deepcopy(plantilla.clientes)
+    sistema._placas_taxis = set(plantilla._placas_taxis)
+    sistema._cedulas_clientes = set(plantilla._cedulas_clientes)
+
+
+# ==================== VIGILANCIA DE ASIGNACIONES ====================
+# Cada taxi que entrega buscar_taxi_cercano queda reservado hasta que
+# _liberar_taxi lo devuelve: dos reservas vivas del mismo taxi significan
+# que se entregó a dos clientes a la vez
+
+def _vigilar_asignaciones(sistema: SistemaCentral) -> list:
+    """
+    Envuelve buscar_taxi_cercano y _liberar_taxi de `sistema` para contar
+    las reservas vivas de cada taxi y devuelve la lista donde se anotan
+    los IDs de los taxis reservados estando ya ocupados.
+    """
+    reservas = Counter()
+    dobles_asignaciones = []
+    lock_vigilancia = threading.Lock()
+    buscar_original = sistema.buscar_taxi_cercano
+    liberar_original = sistema._liberar_taxi
+    
+    def buscar_vigilado(origen):
+        taxi = buscar_original(origen)
+        if taxi is not None:
+            with lock_vigilancia:
+                reservas[taxi.id_taxi] += 1
+                if reservas[taxi.id_taxi] > 1:
+                    dobles_asignaciones.append(taxi.id_taxi)
+        return taxi
+    
+    def liberar_vigilado(taxi):
+        # Se descuenta antes de que el taxi vuelva a estar disponible
+        with lock_vigilancia:
+            reservas[taxi.id_taxi] -= 1
+        liberar_original(taxi)
+    
+    sistema.buscar_taxi_cercano = buscar_vigilado
+    sistema._liberar_taxi = liberar_vigilado
+    return dobles_asignaciones
+
+
+def _dejar_de_vigilar(sistema: SistemaCentral):
+    """Quita los envoltorios de _vigilar_asignaciones (vuelven los métodos de clase)"""
+    del sistema.buscar_taxi_cercano
+    del sistema._liberar_taxi
+
+
+# ==================== POOL DE SISTEMAS ====================
+# Cada prueba toma un SistemaCentral ya construido y lo devuelve reseteado;
+# la cola permite que las clases ejecutadas en paralelo no compartan sistema
+
+_SISTEMAS_LIBRES: SimpleQueue = SimpleQueue()
+_SISTEMAS_DESCARTADOS: set = set()  # Con hilos que no terminaron a tiempo
+
+
+def _tomar_sistema() -> SistemaCentral:
+    try:
+        return _SISTEMAS_LIBRES.get_nowait()
+    except Empty:
+        return SistemaCentral(num_dias=1)
+
+
+def _devolver_sistema(sistema: SistemaCentral):
+    if sistema in _SISTEMAS_DESCARTADOS:
+        return
+    sistema._reset()
+    _SISTEMAS_LIBRES.put(sistema)
+
+
+def _descartar_sistema(sistema: SistemaCentral):
+    _SISTEMAS_DESCARTADOS.add(sistema)
+
+
+class _PruebaConSistema(unittest.TestCase):
+    """Base de las pruebas: self.sistema sale del pool y vuelve al terminar"""
+    
+    def setUp(self):
+        self.sistema = _tomar_sistema()
+        self.addCleanup(_devolver_sistema, self.sistema)
+
+
 # ==================== PRUEBAS DE SINCRONIZACIÓN ====================
 
-class TestSincronizacion(unittest.TestCase):
+class TestSincronizacion(_PruebaConSistema):
     """Pruebas de sincronización y secciones críticas"""
     
-    def setUp(self):
-        """Configuración inicial para cada prueba"""
-        self.sistema = SistemaCentral(num_dias=1)
+    @classmethod
+    def setUpClass(cls):
+        """Afilia una sola vez las flotas de cada escenario"""
+        # Escenarios de carrera: título, plantilla, solicitudes por hilo, timeout (s)
+        cls._CASOS_CARRERA = {
+            "CP-SC-01": ("Race Condition en Lista de Taxis",
+                         _crear_plantilla(3, 5, "ABC", 100000, 200000),
+                         _ITERACIONES_CARRERA, None),
+            "CP-SC-02": ("Modificación Concurrente Servicios",
+                         _crear_plantilla(10, 10, "DEF", 300000, 400000, "Honda", "Civic"),
+                         1, None),
+            "CP-SC-03": ("Asignación Simultánea Mismo Taxi",
+                         _crear_plantilla(1, 2, "UNI", 500000, 600000),
+                         1, 5.0),
+            "CP-SC-04": ("Actualización Concurrente Calificaciones",
+                         _crear_plantilla(5, 5, "CAL", 700000, 800000),
+                         1, None),
+        }
+    
+    def _correr_carrera(self, caso: str) -> list:
+        """
+        Andamiaje común de los escenarios de carrera: carga la plantilla,
+        sitúa a todos los clientes en Puerta del Sol con destino Puerta de
+        Alcalá y lanza sus solicitudes a la vez.
+        
+        Returns:
+            IDs de los taxis entregados estando ya ocupados (vacía si no hubo)
+        """
+        titulo, plantilla, iteraciones, timeout = self._CASOS_CARRERA[caso]
+        _p(_BANNER)
+        _p(f"🧪 TEST {caso}: {titulo}")
+        _p(_BANNER_END)
+        
+        _cargar_plantilla(self.sistema, plantilla)
+        dobles_asignaciones = _vigilar_asignaciones(self.sistema)
+        self.addCleanup(_dejar_de_vigilar, self.sistema)
+        for cliente in self.sistema.clientes:
+            cliente.ubicacion_actual = (40.4168, -3.7034)  # Puerta del Sol
+            cliente.destino = (40.4200, -3.6887)  # Puerta de Alcalá
+        
+        _ejecutar_concurrente(self.sistema, self.sistema.clientes, iteraciones, timeout)
+        return dobles_asignaciones
     
     def test_CP_SC_01_race_condition_lista_taxis(self):
         """
         CP-SC-01: Race Condition en Lista de Taxis
         
-        Entrada: 5 clientes solicitan simultáneamente, 3 taxis disponibles
+        Entrada: 5 clientes solicitan simultáneamente, 3 taxis disponibles,
+                 cada cliente repite la solicitud _ITERACIONES_CARRERA veces
         Resultado esperado: Solo un hilo modifica cada taxi a la vez
-        Verifica: Semáforo mutex_match y mutex_taxis
+        Verifica: mutex_match y rw_taxis
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-SC-01: Race Condition en Lista de Taxis")
-        print("="*60)
+        dobles_asignaciones = self._correr_carrera("CP-SC-01")
         
-        # Crear 3 taxis
-        for i in range(3):
-            self.sistema.afiliar_taxi(
-                100000 + i, f"Taxi{i}", "Driver", f"ABC{i:03d}", 
-                "Toyota", "Corolla", 60
-            )
-        
-        # Crear 5 clientes que soliciten simultáneamente
-        clientes = []
-        for i in range(5):
-            self.sistema.afiliar_cliente(
-                200000 + i, f"Cliente{i}", "Test", "4532123456789012"
-            )
-            clientes.append(self.sistema.clientes[-1])
-        
-        # Iniciar solicitudes simultáneas
-        hilos = []
-        for cliente in clientes:
-            hilo = threading.Thread(target=hilo_cliente, args=(self.sistema, cliente, 1))
-            hilos.append(hilo)
-            hilo.start()
-        
-        # Esperar finalización
-        for hilo in hilos:
-            hilo.join()
-        
-        # Verificar que no hay taxis asignados múltiples veces
-        taxis_usados = {}
-        for servicio in self.sistema.servicios_completados:
-            if servicio.id_taxi in taxis_usados:
-                self.fail(f"Taxi {servicio.id_taxi} fue asignado múltiples veces simultáneamente")
-            taxis_usados[servicio.id_taxi] = servicio.id_servicio
+        # Ningún taxi puede entregarse mientras otro cliente lo tiene ocupado
+        self.assertFalse(dobles_asignaciones,
+                         f"Taxis asignados múltiples veces simultáneamente: {dobles_asignaciones}")
         
-        print(f"✅ PASS: No se detectaron asignaciones duplicadas")
-        print(f"   Servicios completados: {len(self.sistema.servicios_completados)}")
-        print(f"   Taxis únicos usados: {len(taxis_usados)}")
+        taxis_usados = Counter(servicio.id_taxi for servicio in self.sistema.servicios_completados)
+        for taxi in self.sistema.taxis:
+            self.assertTrue(taxi.disponible, f"Taxi {taxi.id_taxi} quedó ocupado")
         
         # Verificar que se usaron máximo 3 taxis (los disponibles)
         self.assertLessEqual(len(taxis_usados), 3, "Se usaron más taxis de los disponibles")
+        
+        _p(f"✅ PASS: No se detectaron asignaciones duplicadas")
+        _p(f"   Servicios completados: {len(self.sistema.servicios_completados)}")
+        _p(f"   Taxis únicos usados: {len(taxis_usados)}")
     
+    @unittest.skipUnless(RUN_STRESS, "solo estrés (UNIETAXI_STRESS=1)")
     def test_CP_SC_02_modificacion_concurrente_servicios(self):
         """
         CP-SC-02: Modificación Concurrente de Servicios Completados
         
         Entrada: 10 clientes realizan servicios simultáneamente
         Resultado esperado: Todos los servicios se registran sin pérdida
-        Verifica: Semáforo mutex_servicios_completados
-        """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-SC-02: Modificación Concurrente Servicios")
-        print("="*60)
-        
-        # Crear 10 taxis y 10 clientes
-        for i in range(10):
-            self.sistema.afiliar_taxi(
-                300000 + i, f"Taxi{i}", "Driver", f"DEF{i:03d}",
-                "Honda", "Civic", 60
-            )
-            self.sistema.afiliar_cliente(
-                400000 + i, f"Cliente{i}", "Test", "4532123456789012"
-            )
-        
-        clientes = self.sistema.clientes.copy()
-        
-        # ASIGNAR UBICACIONES A LOS CLIENTES (cerca de los taxis)
-        for cliente in clientes:
-            cliente.ubicacion_actual = (40.4168, -3.7034)  # Puerta del Sol
-            cliente.destino = (40.4200, -3.6887)  # Puerta de Alcalá
-        # Todas las solicitudes simultáneas
-        hilos = []
-        for cliente in clientes:
-            hilo = threading.Thread(target=hilo_cliente, args=(self.sistema, cliente, 1))
-            hilos.append(hilo)
-            hilo.start()
-        
-        for hilo in hilos:
-            hilo.join()
+        Verifica: mutex_servicios
+        """
+        self._correr_carrera("CP-SC-02")
         
         # Verificar que todos los servicios se procesaron
         self.assertGreater(len(self.sistema.servicios_completados), 0, 
                           "No se procesaron servicios")
         
-        # Verificar que no hay IDs duplicados
-        ids_servicios = [s.id_servicio for s in self.sistema.servicios_completados]
-        self.assertEqual(len(ids_servicios), len(set(ids_servicios)),
-                        "Hay IDs de servicios duplicados")
+        # Verificar que no hay IDs duplicados (una sola pasada)
+        ids_vistos = set()
+        for servicio in self.sistema.servicios_completados:
+            id_servicio = servicio.id_servicio
+            self.assertNotIn(id_servicio, ids_vistos, "Hay IDs de servicios duplicados")
+            ids_vistos.add(id_servicio)
         
-        print(f"✅ PASS: Todas las solicitudes se procesaron correctamente")
-        print(f"   Servicios completados: {len(self.sistema.servicios_completados)}")
-        print(f"   IDs únicos verificados: {len(set(ids_servicios))}")
+        _p(f"✅ PASS: Todas las solicitudes se procesaron correctamente")
+        _p(f"   Servicios completados: {len(self.sistema.servicios_completados)}")
+        _p(f"   IDs únicos verificados: {len(ids_vistos)}")
     
     def test_CP_SC_03_asignacion_simultanea_mismo_taxi(self):
         """
@@ -144,44 +340,15 @@ class TestSincronizacion(unittest.TestCase):
         Resultado esperado: Solo uno recibe el taxi
         Verifica: Semáforo mutex_match protege asignación
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-SC-03: Asignación Simultánea Mismo Taxi")
-        print("="*60)
-        
-        # Un solo taxi
-        self.sistema.afiliar_taxi(
-            500000, "TaxiUnico", "Driver", "UNI001",
-            "Toyota", "Corolla", 60
-        )
-        
-        # Dos clientes en la misma ubicación
-        clientes = []
-        for i in range(2):
-            self.sistema.afiliar_cliente(
-                600000 + i, f"Cliente{i}", "Test", "4532123456789012"
-            )
-            cliente = self.sistema.clientes[-1]
-            # Forzar misma ubicación
-            cliente.ubicacion_actual = (40.4168, -3.7034)
-            cliente.destino = (40.4200, -3.6887)
-            clientes.append(cliente)
-        
-        # Solicitudes simultáneas
-        hilos = []
-        for cliente in clientes:
-            hilo = threading.Thread(target=hilo_cliente, args=(self.sistema, cliente, 1))
-            hilos.append(hilo)
-            hilo.start()
-        
-        for hilo in hilos:
-            hilo.join()
+        dobles_asignaciones = self._correr_carrera("CP-SC-03")
+        self.assertFalse(dobles_asignaciones, "El taxi se entregó a dos clientes a la vez")
         
         # Solo debería haber 1 servicio completado
         self.assertEqual(len(self.sistema.servicios_completados), 1,
                         "Se asignó el mismo taxi a múltiples clientes")
         
-        print(f"✅ PASS: Solo un cliente recibió el taxi")
-        print(f"   Servicios completados: {len(self.sistema.servicios_completados)}")
+        _p(f"✅ PASS: Solo un cliente recibió el taxi")
+        _p(f"   Servicios completados: {len(self.sistema.servicios_completados)}")
     
     def test_CP_SC_04_actualizacion_calificaciones(self):
         """
@@ -191,31 +358,10 @@ class TestSincronizacion(unittest.TestCase):
         Resultado esperado: Todas las calificaciones se registran correctamente
         Verifica: Integridad de datos en operaciones concurrentes
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-SC-04: Actualización Concurrente Calificaciones")
-        print("="*60)
-        
-        # 5 taxis y 5 clientes
-        for i in range(5):
-            self.sistema.afiliar_taxi(
-                700000 + i, f"Taxi{i}", "Driver", f"CAL{i:03d}",
-                "Toyota", "Corolla", 60
-            )
-            self.sistema.afiliar_cliente(
-                800000 + i, f"Cliente{i}", "Test", "4532123456789012"
-            )
-        
-        clientes = self.sistema.clientes.copy()
-        
-        # Solicitudes simultáneas
-        hilos = []
-        for cliente in clientes:
-            hilo = threading.Thread(target=hilo_cliente, args=(self.sistema, cliente, 1))
-            hilos.append(hilo)
-            hilo.start()
+        self._correr_carrera("CP-SC-04")
         
-        for hilo in hilos:
-            hilo.join()
+        self.assertTrue(any(taxi.cantidad_servicios > 0 for taxi in self.sistema.taxis),
+                        "Ningún taxi recibió calificaciones")
         
         # Verificar que las calificaciones están en rango válido
         for taxi in self.sistema.taxis:
@@ -224,21 +370,62 @@ class TestSincronizacion(unittest.TestCase):
                 self.assertGreaterEqual(promedio, config.CALIFICACIONES["MINIMA"])
                 self.assertLessEqual(promedio, config.CALIFICACIONES["MAXIMA"])
         
-        print(f"✅ PASS: Calificaciones actualizadas correctamente")
+        _p(f"✅ PASS: Calificaciones actualizadas correctamente")
         for taxi in self.sistema.taxis:
             if taxi.cantidad_servicios > 0:
-                print(f"   {taxi.placa}: {taxi.calcular_calificacion_promedio():.2f}⭐ "
-                      f"({taxi.cantidad_servicios} servicios)")
+                _p(f"   {taxi.placa}: {taxi.calcular_calificacion_promedio():.2f}⭐ "
+                   f"({taxi.cantidad_servicios} servicios)")
+    
+    def test_CP_SC_05_lock_lectores_escritor(self):
+        """
+        CP-SC-05: Lock Lectores-Escritor de la Lista de Taxis
+        
+        Entrada: 3 lectores simultáneos y 1 escritor
+        Resultado esperado: Los lectores comparten el lock; el escritor
+        entra solo cuando todos los lectores han salido
+        Verifica: rw_taxis
+        """
+        _p(_BANNER)
+        _p("🧪 TEST CP-SC-05: Lock Lectores-Escritor")
+        _p(_BANNER_END)
+        
+        rw = self.sistema.rw_taxis
+        barrera = threading.Barrier(3)
+        todos_dentro = threading.Event()
+        escritor_vio_lectores = []
+        
+        def lector():
+            with rw.read_locked():
+                # Los 3 lectores deben poder estar dentro a la vez
+                if barrera.wait(timeout=2.0) == 0:
+                    todos_dentro.set()
+                time.sleep(0.05)
+        
+        def escritor():
+            with rw.write_locked():
+                escritor_vio_lectores.append(rw._lectores)
+        
+        hilos = [threading.Thread(target=lector) for _ in range(3)]
+        for hilo in hilos:
+            hilo.start()
+        
+        self.assertTrue(todos_dentro.wait(timeout=2.0), "Los lectores no compartieron el lock")
+        hilo_escritor = threading.Thread(target=escritor)
+        hilo_escritor.start()
+        
+        for hilo in hilos + [hilo_escritor]:
+            hilo.join()
+        
+        self.assertEqual(escritor_vio_lectores, [0], "El escritor entró con lectores dentro")
+        
+        _p(f"✅ PASS: Lectores concurrentes y escritor exclusivo")
 
 
 # ==================== PRUEBAS DE CASOS EXTREMOS ====================
 
-class TestCasosExtremos(unittest.TestCase):
+class TestCasosExtremos(_PruebaConSistema):
     """Pruebas de casos extremos"""
     
-    def setUp(self):
-        self.sistema = SistemaCentral(num_dias=1)
-    
     def test_CP_EXT_01_no_hay_taxis_disponibles(self):
         """
         CP-EXT-01: No Hay Taxis Disponibles
@@ -246,13 +433,12 @@ class TestCasosExtremos(unittest.TestCase):
         Entrada: Cliente solicita pero no hay taxis
         Resultado esperado: Sistema informa que no hay taxis
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-EXT-01: No Hay Taxis Disponibles")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-EXT-01: No Hay Taxis Disponibles")
+        _p(_BANNER_END)
         
         # Crear cliente pero NO taxis
-        self.sistema.afiliar_cliente(900000, "Cliente", "Solo", "4532123456789012")
-        cliente = self.sistema.clientes[-1]
+        cliente = self.sistema.afiliar_cliente(900000, "Cliente", "Solo", "4532123456789012")
         cliente.ubicacion_actual = (40.4168, -3.7034)
         cliente.destino = (40.4200, -3.6887)
         
@@ -262,7 +448,7 @@ class TestCasosExtremos(unittest.TestCase):
         self.assertIsNone(taxi, "Se asignó un taxi cuando no hay disponibles")
         self.assertEqual(len(self.sistema.servicios_completados), 0)
         
-        print(f"✅ PASS: Sistema manejó correctamente la ausencia de taxis")
+        _p(f"✅ PASS: Sistema manejó correctamente la ausencia de taxis")
     
     def test_CP_EXT_02_taxis_fuera_de_radio(self):
         """
@@ -271,21 +457,19 @@ class TestCasosExtremos(unittest.TestCase):
         Entrada: Cliente en (40.4168, -3.7034), taxi lejos
         Resultado esperado: No se asigna taxi fuera del radio
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-EXT-02: Taxis Fuera de Radio")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-EXT-02: Taxis Fuera de Radio")
+        _p(_BANNER_END)
         
         # Crear taxi lejos
-        self.sistema.afiliar_taxi(
+        taxi = self.sistema.afiliar_taxi(
             1000000, "TaxiLejos", "Driver", "LEJ001",
             "Toyota", "Corolla", 60
         )
-        taxi = self.sistema.taxis[-1]
         taxi.ubicacion = (40.5000, -3.5000)  # Muy lejos
         
         # Cliente en centro
-        self.sistema.afiliar_cliente(1100000, "Cliente", "Cerca", "4532123456789012")
-        cliente = self.sistema.clientes[-1]
+        cliente = self.sistema.afiliar_cliente(1100000, "Cliente", "Cerca", "4532123456789012")
         cliente.ubicacion_actual = (40.4168, -3.7034)
         cliente.destino = (40.4200, -3.6887)
         
@@ -296,9 +480,9 @@ class TestCasosExtremos(unittest.TestCase):
         
         if distancia > config.TAXI_CONFIG["RADIO_BUSQUEDA_KM"]:
             self.assertIsNone(taxi_asignado, "Se asignó un taxi fuera del radio")
-            print(f"✅ PASS: Taxi a {distancia:.2f} km correctamente rechazado")
+            _p(f"✅ PASS: Taxi a {distancia:.2f} km correctamente rechazado")
         else:
-            print(f"⚠️ Taxi estaba dentro del radio: {distancia:.2f} km")
+            _p(f"⚠️ Taxi estaba dentro del radio: {distancia:.2f} km")
     
     def test_CP_EXT_03_todos_taxis_ocupados(self):
         """
@@ -307,30 +491,25 @@ class TestCasosExtremos(unittest.TestCase):
         Entrada: Todos los taxis marcados como no disponibles
         Resultado esperado: Cliente no recibe taxi
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-EXT-03: Todos los Taxis Ocupados")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-EXT-03: Todos los Taxis Ocupados")
+        _p(_BANNER_END)
         
         # Crear 3 taxis
-        for i in range(3):
-            self.sistema.afiliar_taxi(
-                1200000 + i, f"Taxi{i}", "Driver", f"OCP{i:03d}",
-                "Toyota", "Corolla", 60
-            )
+        self.sistema.afiliar_taxis_bulk(_registros_taxis(3, 1200000, "OCP"))
         
         # Marcar todos como ocupados
         for taxi in self.sistema.taxis:
             taxi.disponible = False
         
         # Intentar solicitar taxi
-        self.sistema.afiliar_cliente(1300000, "Cliente", "Esperando", "4532123456789012")
-        cliente = self.sistema.clientes[-1]
+        cliente = self.sistema.afiliar_cliente(1300000, "Cliente", "Esperando", "4532123456789012")
         cliente.ubicacion_actual = (40.4168, -3.7034)
         
         taxi = self.sistema.asignar_taxi(cliente)
         
         self.assertIsNone(taxi, "Se asignó un taxi ocupado")
-        print(f"✅ PASS: No se asignaron taxis ocupados")
+        _p(f"✅ PASS: No se asignaron taxis ocupados")
     
     def test_CP_EXT_04_tarjeta_invalida(self):
         """
@@ -339,27 +518,49 @@ class TestCasosExtremos(unittest.TestCase):
         Entrada: Tarjeta con menos de 16 dígitos
         Resultado esperado: Registro rechazado
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-EXT-04: Tarjeta Inválida")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-EXT-04: Tarjeta Inválida")
+        _p(_BANNER_END)
         
         # Intentar afiliar con tarjeta de 15 dígitos
         resultado = self.sistema.afiliar_cliente(
             1500000, "Cliente", "TarjetaMala", "453212345678901"  # 15 dígitos
         )
         
-        self.assertFalse(resultado, "Se aceptó una tarjeta inválida")
-        print(f"✅ PASS: Tarjeta inválida rechazada correctamente")
+        self.assertIsNone(resultado, "Se aceptó una tarjeta inválida")
+        _p(f"✅ PASS: Tarjeta inválida rechazada correctamente")
+    
+    def test_CP_EXT_05_afiliacion_duplicada(self):
+        """
+        CP-EXT-05: Afiliación Duplicada
+        
+        Entrada: Misma cédula de cliente y misma placa de taxi dos veces
+        Resultado esperado: El segundo registro es rechazado
+        """
+        _p(_BANNER)
+        _p("🧪 TEST CP-EXT-05: Afiliación Duplicada")
+        _p(_BANNER_END)
+        
+        self.assertIsNotNone(self.sistema.afiliar_cliente(1550000, "Cliente", "Uno", "4532123456789012"))
+        self.assertIsNone(self.sistema.afiliar_cliente(1550000, "Cliente", "Dos", "4532123456789012"),
+                         "Se aceptó una cédula duplicada")
+        
+        self.assertIsNotNone(self.sistema.afiliar_taxi(1560000, "Taxi", "Uno", "DUP001",
+                                                       "Toyota", "Corolla", 60))
+        self.assertIsNone(self.sistema.afiliar_taxi(1560001, "Taxi", "Dos", "DUP001",
+                                                    "Toyota", "Corolla", 60),
+                         "Se aceptó una placa duplicada")
+        
+        self.assertEqual(len(self.sistema.clientes), 1)
+        self.assertEqual(len(self.sistema.taxis), 1)
+        _p(f"✅ PASS: Duplicados rechazados correctamente")
 
 
 # ==================== PRUEBAS DE FUNCIONALIDAD BÁSICA ====================
 
-class TestFuncionalidadBasica(unittest.TestCase):
+class TestFuncionalidadBasica(_PruebaConSistema):
     """Pruebas de funcionalidad básica"""
     
-    def setUp(self):
-        self.sistema = SistemaCentral(num_dias=1)
-    
     def test_CP_FUN_01_registro_cliente_valido(self):
         """
         CP-FUN-01: Registro de Cliente Válido
@@ -367,9 +568,9 @@ class TestFuncionalidadBasica(unittest.TestCase):
         Entrada: Cliente con datos válidos
         Resultado esperado: Cliente registrado exitosamente
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-FUN-01: Registro Cliente Válido")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-FUN-01: Registro Cliente Válido")
+        _p(_BANNER_END)
         
         resultado = self.sistema.afiliar_cliente(
             1600000, "Juan", "Pérez", "4532123456789012"
@@ -379,7 +580,7 @@ class TestFuncionalidadBasica(unittest.TestCase):
         self.assertEqual(len(self.sistema.clientes), 1)
         self.assertEqual(self.sistema.clientes[0].nombre, "Juan")
         
-        print(f"✅ PASS: Cliente afiliado correctamente")
+        _p(f"✅ PASS: Cliente afiliado correctamente")
     
     def test_CP_FUN_02_registro_taxi_valido(self):
         """
@@ -388,9 +589,9 @@ class TestFuncionalidadBasica(unittest.TestCase):
         Entrada: Taxi con documentación completa
         Resultado esperado: Taxi registrado exitosamente
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-FUN-02: Registro Taxi Válido")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-FUN-02: Registro Taxi Válido")
+        _p(_BANNER_END)
         
         resultado = self.sistema.afiliar_taxi(
             1700000, "Carlos", "Rodríguez", "ABC123",
@@ -401,7 +602,7 @@ class TestFuncionalidadBasica(unittest.TestCase):
         self.assertEqual(len(self.sistema.taxis), 1)
         self.assertEqual(self.sistema.taxis[0].placa, "ABC123")
         
-        print(f"✅ PASS: Taxi afiliado correctamente")
+        _p(f"✅ PASS: Taxi afiliado correctamente")
     
     def test_CP_FUN_03_calculo_distancia(self):
         """
@@ -410,9 +611,9 @@ class TestFuncionalidadBasica(unittest.TestCase):
         Entrada: Puntos (0,0) y (3,4)
         Resultado esperado: Distancia = 5.0 (triángulo 3-4-5)
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-FUN-03: Cálculo de Distancia")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-FUN-03: Cálculo de Distancia")
+        _p(_BANNER_END)
         
         punto1 = (0.0, 0.0)
         punto2 = (3.0, 4.0)
@@ -422,7 +623,32 @@ class TestFuncionalidadBasica(unittest.TestCase):
         
         self.assertAlmostEqual(distancia, esperada, places=2)
         
-        print(f"✅ PASS: Distancia calculada correctamente: {distancia:.2f} km")
+        _p(f"✅ PASS: Distancia calculada correctamente: {distancia:.2f} km")
+    
+    def test_CP_FUN_03b_distancia_masiva(self):
+        """
+        CP-FUN-03b: Cálculo de Distancia Masivo
+        
+        Entrada: 10.000 pares de puntos aleatorios (semilla fija)
+        Resultado esperado: Coincide con la referencia math.hypot
+        """
+        _p(_BANNER)
+        _p("🧪 TEST CP-FUN-03b: Cálculo de Distancia Masivo")
+        _p(_BANNER_END)
+        
+        rng = random.Random(2024)
+        pares = [((rng.random(), rng.random()), (rng.random(), rng.random()))
+                 for _ in range(10_000)]
+        
+        calcular = self.sistema.calcular_distancia
+        error_maximo = max(
+            abs(calcular(p1, p2) - math.hypot(p2[0] - p1[0], p2[1] - p1[1]))
+            for p1, p2 in pares
+        )
+        
+        self.assertLess(error_maximo, 1e-12, "calcular_distancia se aleja de la referencia")
+        
+        _p(f"✅ PASS: {len(pares)} distancias verificadas (error máximo {error_maximo:.1e})")
     
     def test_CP_FUN_04_desempate_calificacion(self):
         """
@@ -431,27 +657,26 @@ class TestFuncionalidadBasica(unittest.TestCase):
         Entrada: Dos taxis a misma distancia, diferentes calificaciones
         Resultado esperado: Se elige el mejor calificado
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-FUN-04: Desempate por Calificación")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-FUN-04: Desempate por Calificación")
+        _p(_BANNER_END)
         
         # Crear dos taxis
-        self.sistema.afiliar_taxi(1800000, "TaxiA", "Driver", "AAA001",
-                                  "Toyota", "Corolla", 60)
-        self.sistema.afiliar_taxi(1800001, "TaxiB", "Driver", "BBB002",
-                                  "Honda", "Civic", 60)
+        taxi_a = self.sistema.afiliar_taxi(1800000, "TaxiA", "Driver", "AAA001",
+                                           "Toyota", "Corolla", 60)
+        taxi_b = self.sistema.afiliar_taxi(1800001, "TaxiB", "Driver", "BBB002",
+                                           "Honda", "Civic", 60)
         
         # Misma ubicación
-        self.sistema.taxis[0].ubicacion = (40.4169, -3.7034)
-        self.sistema.taxis[1].ubicacion = (40.4169, -3.7034)
+        taxi_a.ubicacion = (40.4169, -3.7034)
+        taxi_b.ubicacion = (40.4169, -3.7034)
         
         # Diferentes calificaciones
-        self.sistema.taxis[0].agregar_calificacion(3)
-        self.sistema.taxis[1].agregar_calificacion(5)
+        taxi_a.agregar_calificacion(3)
+        taxi_b.agregar_calificacion(5)
         
         # Cliente
-        self.sistema.afiliar_cliente(1900000, "Cliente", "Test", "4532123456789012")
-        cliente = self.sistema.clientes[-1]
+        cliente = self.sistema.afiliar_cliente(1900000, "Cliente", "Test", "4532123456789012")
         cliente.ubicacion_actual = (40.4168, -3.7034)
         
         # Asignar taxi
@@ -460,34 +685,31 @@ class TestFuncionalidadBasica(unittest.TestCase):
         self.assertIsNotNone(taxi)
         self.assertEqual(taxi.placa, "BBB002", "No se seleccionó el mejor calificado")
         
-        print(f"✅ PASS: Se seleccionó el taxi con mejor calificación")
+        _p(f"✅ PASS: Se seleccionó el taxi con mejor calificación")
 
 
 # ==================== PRUEBAS DE LÓGICA DE NEGOCIO ====================
 
-class TestLogicaNegocio(unittest.TestCase):
+class TestLogicaNegocio(_PruebaConSistema):
     """Pruebas de lógica de negocio"""
     
-    def setUp(self):
-        self.sistema = SistemaCentral(num_dias=1)
-    
     def test_CP_NEG_01_calculo_tarifa(self):
         """
         CP-NEG-01: Cálculo de Tarifa
         
         Verifica: distancia * tarifa_por_km
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-NEG-01: Cálculo de Tarifa")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-NEG-01: Cálculo de Tarifa")
+        _p(_BANNER_END)
         
         distancia = 10.0
         costo_esperado = distancia * config.TAXI_CONFIG["TARIFA_POR_KM"]
         
-        print(f"   Distancia: {distancia} km")
-        print(f"   Tarifa: ${config.TAXI_CONFIG['TARIFA_POR_KM']}/km")
-        print(f"   Costo esperado: ${costo_esperado:.2f}")
-        print(f"✅ PASS: Fórmula verificada")
+        _p(f"   Distancia: {distancia} km")
+        _p(f"   Tarifa: ${config.TAXI_CONFIG['TARIFA_POR_KM']}/km")
+        _p(f"   Costo esperado: ${costo_esperado:.2f}")
+        _p(f"✅ PASS: Fórmula verificada")
     
     def test_CP_NEG_02_comision_empresa(self):
         """
@@ -496,13 +718,12 @@ class TestLogicaNegocio(unittest.TestCase):
         Entrada: Taxi con ganancia de $100
         Resultado esperado: Empresa $20, Taxista $80
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-NEG-02: Comisión 20%")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-NEG-02: Comisión 20%")
+        _p(_BANNER_END)
         
-        self.sistema.afiliar_taxi(2000000, "Taxi", "Test", "COM001",
-                                  "Toyota", "Corolla", 60)
-        taxi = self.sistema.taxis[-1]
+        taxi = self.sistema.afiliar_taxi(2000000, "Taxi", "Test", "COM001",
+                                         "Toyota", "Corolla", 60)
         
         taxi.agregar_ganancia(100.0)
         
@@ -512,10 +733,10 @@ class TestLogicaNegocio(unittest.TestCase):
         self.assertAlmostEqual(comision, 20.0, places=2)
         self.assertAlmostEqual(ganancia_neta, 80.0, places=2)
         
-        print(f"   Ganancia: $100.00")
-        print(f"   UNIETAXI (20%): ${comision:.2f}")
-        print(f"   Taxista (80%): ${ganancia_neta:.2f}")
-        print(f"✅ PASS: Comisión calculada correctamente")
+        _p(f"   Ganancia: $100.00")
+        _p(f"   UNIETAXI (20%): ${comision:.2f}")
+        _p(f"   Taxista (80%): ${ganancia_neta:.2f}")
+        _p(f"✅ PASS: Comisión calculada correctamente")
 
 
 # ==================== PRUEBAS DE INTEGRACIÓN ====================
@@ -529,18 +750,17 @@ class TestIntegracion(unittest.TestCase):
         
         Verifica todo el ciclo: solicitud → asignación → servicio → calificación
         """
-        print("\n" + "="*60)
-        print("🧪 TEST CP-INT-01: Flujo Completo de Servicio")
-        print("="*60)
+        _p(_BANNER)
+        _p("🧪 TEST CP-INT-01: Flujo Completo de Servicio")
+        _p(_BANNER_END)
         
         sistema = SistemaCentral(num_dias=1)
         
         # Afiliar taxi y cliente
         sistema.afiliar_taxi(2100000, "Taxi", "Completo", "INT001",
                             "Toyota", "Corolla", 60)
-        sistema.afiliar_cliente(2200000, "Cliente", "Completo", "4532123456789012")
+        cliente = sistema.afiliar_cliente(2200000, "Cliente", "Completo", "4532123456789012")
         
-        cliente = sistema.clientes[-1]
         # CORREGIDO: Asignar ubicación en Madrid
         cliente.ubicacion_actual = (40.4168, -3.7034)  # Puerta del Sol
         cliente.destino = (40.4200, -3.6887)            # Puerta de Alcalá
@@ -558,14 +778,84 @@ class TestIntegracion(unittest.TestCase):
         self.assertTrue(servicio.completado)
         self.assertGreater(servicio.calificacion, 0)
         
-        print(f"✅ PASS: Flujo completo ejecutado")
-        print(f"   Servicio ID: {servicio.id_servicio}")
-        print(f"   Calificación: {servicio.calificacion}⭐")
-        print(f"   Costo: ${servicio.costo:.2f}")
+        _p(f"✅ PASS: Flujo completo ejecutado")
+        _p(f"   Servicio ID: {servicio.id_servicio}")
+        _p(f"   Calificación: {servicio.calificacion}⭐")
+        _p(f"   Costo: ${servicio.costo:.2f}")
 
 
 # ==================== EJECUCIÓN DE PRUEBAS ====================
 
+class _SalidaPorHilo:
+    """
+    Sustituto de sys.stdout que envía lo escrito por cada hilo de prueba a
+    su propio buffer; el resto de hilos escribe en la salida original.
+    """
+    
+    def __init__(self, destino):
+        self.destino = destino
+        self._local = threading.local()
+    
+    def capturar(self) -> io.StringIO:
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def _actual(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self.destino if buffer is None else buffer
+    
+    def write(self, texto: str) -> int:
+        return self._actual().write(texto)
+    
+    def flush(self):
+        self._actual().flush()
+
+
+def _ejecutar_en_paralelo(suites) -> unittest.TestResult:
+    """
+    Ejecuta cada prueba de `suites` en su propio hilo y combina los resultados.
+    Solo para clases sin estado compartido entre métodos (cada setUp crea
+    su propio SistemaCentral).
+    
+    Cada hilo tiene su propio TestResult y captura sus print y registros del
+    logger en un buffer; tras el join se vuelcan en el orden de la suite,
+    sin mezclarse entre pruebas.
+    """
+    pruebas = [prueba for suite in suites for prueba in suite]
+    salida = _SalidaPorHilo(sys.stdout)
+    
+    def correr(prueba):
+        buffer = salida.capturar()
+        resultado = unittest.TestResult()
+        prueba(resultado)
+        return resultado, buffer.getvalue()
+    
+    # El StreamHandler del logger guarda su propio stream: también se redirige
+    manejadores = [manejador for manejador in logging.getLogger("unietaxi").handlers
+                   if isinstance(manejador, logging.StreamHandler)]
+    streams_originales = [manejador.setStream(salida) for manejador in manejadores]
+    sys.stdout = salida
+    try:
+        with ThreadPoolExecutor(max_workers=len(pruebas)) as pool:
+            ejecuciones = list(pool.map(correr, pruebas))
+    finally:
+        sys.stdout = salida.destino
+        for manejador, stream in zip(manejadores, streams_originales):
+            manejador.setStream(stream)
+    
+    combinado = unittest.TestResult()
+    for resultado, texto in ejecuciones:
+        sys.stdout.write(texto)
+        combinado.testsRun += resultado.testsRun
+        combinado.failures.extend(resultado.failures)
+        combinado.errors.extend(resultado.errors)
+        combinado.skipped.extend(resultado.skipped)
+        combinado.expectedFailures.extend(resultado.expectedFailures)
+        combinado.unexpectedSuccesses.extend(resultado.unexpectedSuccesses)
+    sys.stdout.flush()
+    return combinado
+
+
 def run_all_tests():
     """Ejecuta todos los casos de prueba"""
     print("\n" + "="*70)
@@ -576,34 +866,58 @@ def run_all_tests():
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
     
-    # Agregar todas las clases
+    # Clases secuenciales (sincronización observa hilos globales)
     suite.addTests(loader.loadTestsFromTestCase(TestSincronizacion))
-    suite.addTests(loader.loadTestsFromTestCase(TestCasosExtremos))
-    suite.addTests(loader.loadTestsFromTestCase(TestFuncionalidadBasica))
     suite.addTests(loader.loadTestsFromTestCase(TestLogicaNegocio))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegracion))
     
-    # Ejecutar
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    # Clases independientes: se ejecutan en paralelo
+    paralelas = [
+        loader.loadTestsFromTestCase(TestCasosExtremos),
+        loader.loadTestsFromTestCase(TestFuncionalidadBasica),
+    ]
+    
+    # Ejecutar (UNIETAXI_PROFILE=1 imprime las 30 funciones más costosas
+    # del hilo principal)
+    runner = unittest.TextTestRunner(verbosity=1, stream=sys.stderr)
+    perfil = cProfile.Profile() if os.environ.get("UNIETAXI_PROFILE") == "1" else None
+    if perfil is not None:
+        perfil.enable()
+    try:
+        result = runner.run(suite)
+        resultado_paralelo = _ejecutar_en_paralelo(paralelas)
+    finally:
+        if perfil is not None:
+            perfil.disable()
+            pstats.Stats(perfil).sort_stats("cumulative").print_stats(30)
+    
+    for prueba, traza in resultado_paralelo.failures + resultado_paralelo.errors:
+        print(f"\n❌ {prueba.id()}\n{traza}")
+    
+    total = result.testsRun + resultado_paralelo.testsRun
+    fallidas = len(result.failures) + len(resultado_paralelo.failures)
+    errores = len(result.errors) + len(resultado_paralelo.errors)
+    omitidas = len(result.skipped) + len(resultado_paralelo.skipped)
+    exito = result.wasSuccessful() and resultado_paralelo.wasSuccessful()
     
     # Resumen
     print("\n" + "="*70)
     print("RESUMEN DE PRUEBAS")
     print("="*70)
-    print(f"Total de pruebas: {result.testsRun}")
-    print(f"✅ Exitosas: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"❌ Fallidas: {len(result.failures)}")
-    print(f"⚠️ Errores: {len(result.errors)}")
+    print(f"Total de pruebas: {total}")
+    print(f"✅ Exitosas: {total - fallidas - errores - omitidas}")
+    print(f"❌ Fallidas: {fallidas}")
+    print(f"⚠️ Errores: {errores}")
+    print(f"⏭️ Omitidas: {omitidas}")
     
-    if result.wasSuccessful():
+    if exito:
         print("\n🎉 ¡Todas las pruebas pasaron exitosamente!")
     else:
         print("\n⚠️ Algunas pruebas fallaron")
     
     print("="*70 + "\n")
     
-    return result.wasSuccessful()
+    return exito
 
 
 if __name__ == "__main__":
@@ -5,24 +5,56 @@ Este módulo genera un mapa interactivo HTML con animación de taxis
 basado en los datos reales del sistema.
 """
 
+import functools
+import gzip
+import hashlib
 import json
 import os
+import re
+import string
+from types import MappingProxyType
+
 import config
 
+# Taxis registrados en la raíz del proyecto (fuera de data/)
+ARCHIVO_TAXIS = os.path.join(config.BASE_DIR, "taxis_registrados.json")
+
+# Copia comprimida del mapa, para servirla o archivarla
+ARCHIVO_MAPA_GZ = config.MAPA_HTML + ".gz"
+
+# Clave de la última generación, junto al HTML
+ARCHIVO_CACHE_KEY = config.MAPA_HTML + ".cache_key"
+
+# Codificador JSON reutilizable y sin espacios (json.dumps con opciones crea uno por llamada)
+# default=dict: las rutas compartidas son MappingProxyType (solo lectura)
+_JSON_COMPACTO = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=dict)
+
 # ==================== CARGA DE DATOS ====================
 
+@functools.lru_cache(maxsize=4)
+def _leer_taxis(mtime, ruta):
+    """
+    Lee y decodifica el archivo de taxis. El mtime forma parte de la clave
+    de la caché: si el archivo cambia, se vuelve a leer.
+    """
+    # Lectura binaria de una sola vez; json.loads decodifica el UTF-8
+    with open(ruta, "rb", buffering=65536) as f:
+        return json.loads(f.read())
+
+
 def cargar_taxis_registrados():
     """
     Carga los taxis desde el archivo JSON en la raíz del proyecto.
     
+    Las lecturas repetidas sin cambios en el archivo salen de caché, así
+    que la lista devuelta es compartida y no debe modificarse.
+    
     Returns:
         Lista de taxis o lista vacía si no existe
     """
     try:
-        # Buscar taxis_registrados.json en la raíz del proyecto (fuera de data/)
-        archivo_taxis = os.path.join(config.BASE_DIR, "taxis_registrados.json")
-        with open(archivo_taxis, "r", encoding="utf-8") as f:
-            taxistas_registrados = json.load(f)
+        archivo_taxis = ARCHIVO_TAXIS
+        taxistas_registrados = _leer_taxis(os.path.getmtime(archivo_taxis), archivo_taxis)
         print(f"✅ Cargados {len(taxistas_registrados)} taxis desde {archivo_taxis}")
         return taxistas_registrados
     except FileNotFoundError:
@@ -42,14 +74,180 @@ def cargar_configuracion_mapa():
     """
     config_file = os.path.join(config.DATA_DIR, "config_mapa.json")
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(config_file, "rb", buffering=65536) as f:
+            return json.loads(f.read())
     except FileNotFoundError:
         return None
 
 
 # ==================== GENERACIÓN DE RUTAS ====================
 
+# Destino común de todas las rutas (Sol)
+_SOL = (config.CENTRO_MADRID["lat"], config.CENTRO_MADRID["lng"])
+
+# Emoji del panel de control para cada taxi, en el orden de las rutas
+_EMOJIS_TAXI = ('🟠', '🟣', '🔴', '🟢', '⚫', '🔵', '🌸', '🟤')
+
+# Pasos de animación por tramo de ruta
+_PASOS_POR_TRAMO = 50
+
+# Decimales de lat/lng en la trayectoria (5 ≈ 1 m, suficiente para el mapa)
+_DECIMALES_COORD = 5
+
+# Rutas predefinidas para diferentes taxis, construidas una sola vez
+_RUTAS_PREDEFINIDAS = (
+    # Taxi 1: Desde Ópera
+    {
+        "nombre": "Taxi 1 (Ópera)",
+        "ruta": [
+            [40.4178, -3.7094],
+            [40.4177, -3.7085],
+            [40.4168, -3.7047],
+            _SOL
+        ],
+        "color": "orange",
+        "bg": "orange"
+    },
+    # Taxi 2: Desde Plaza España
+    {
+        "nombre": "Taxi 2 (Plaza España)",
+        "ruta": [
+            [40.4234, -3.7109],
+            [40.4203, -3.7059],
+            [40.4200, -3.7014],
+            _SOL
+        ],
+        "color": "purple",
+        "bg": "purple"
+    },
+    # Taxi 3: Desde Retiro
+    {
+        "nombre": "Taxi 3 (Retiro)",
+        "ruta": [
+            [40.4153, -3.6840],
+            [40.4170, -3.6890],
+            [40.4185, -3.6950],
+            _SOL
+        ],
+        "color": "red",
+        "bg": "red"
+    },
+    # Taxi 4: Desde Embajadores
+    {
+        "nombre": "Taxi 4 (Embajadores)",
+        "ruta": [
+            [40.4050, -3.7026],
+            [40.4075, -3.6934],
+            [40.4087, -3.6920],
+            [40.4152, -3.6943],
+            [40.4193, -3.6936],
+            [40.4178, -3.6995],
+            _SOL
+        ],
+        "color": "darkgreen",
+        "bg": "green"
+    },
+    # Taxi 5: Desde Argüelles
+    {
+        "nombre": "Taxi 5 (Argüelles)",
+        "ruta": [
+            [40.4306, -3.7162],
+            [40.4263, -3.7132],
+            [40.4235, -3.7148],
+            [40.4219, -3.7132],
+            [40.4203, -3.7154],
+            [40.4203, -3.7200],
+            [40.4139, -3.7209],
+            [40.4139, -3.7168],
+            [40.4110, -3.7183],
+            [40.4087, -3.7167],
+            [40.4065, -3.7114],
+            [40.4086, -3.7131],
+            [40.4106, -3.7139],
+            [40.4150, -3.7135],
+            [40.4155, -3.7104],
+            [40.4161, -3.7078],
+            _SOL
+        ],
+        "color": "gray",
+        "bg": "gray"
+    },
+    # Taxi 6: Desde Gran Vía
+    {
+        "nombre": "Taxi 6 (Gran Vía)",
+        "ruta": [
+            [40.4200, -3.7100],
+            [40.4190, -3.7070],
+            [40.4175, -3.7045],
+            _SOL
+        ],
+        "color": "blue",
+        "bg": "blue"
+    },
+    # Taxi 7: Desde Atocha
+    {
+        "nombre": "Taxi 7 (Atocha)",
+        "ruta": [
+            [40.4100, -3.6900],
+            [40.4120, -3.6920],
+            [40.4145, -3.6980],
+            _SOL
+        ],
+        "color": "pink",
+        "bg": "pink"
+    },
+    # Taxi 8: Desde Salamanca
+    {
+        "nombre": "Taxi 8 (Salamanca)",
+        "ruta": [
+            [40.4250, -3.6850],
+            [40.4220, -3.6900],
+            [40.4190, -3.6950],
+            _SOL
+        ],
+        "color": "brown",
+        "bg": "brown"
+    }
+)
+
+
+
+def _interpolar_ruta(ruta, pasos=_PASOS_POR_TRAMO):
+    """
+    Expande una ruta en los puntos que recorre la animación.
+    
+    Args:
+        ruta: Lista de puntos [lat, lng]
+        pasos: Puntos intermedios por tramo
+    
+    Returns:
+        Lista de puntos [lat, lng] redondeados, terminando en el destino
+    """
+    # Fracciones comunes a todos los tramos, calculadas una vez
+    fracciones = [paso / pasos for paso in range(pasos)]
+    puntos = [
+        [round(lat1 + (lat2 - lat1) * t, _DECIMALES_COORD),
+         round(lng1 + (lng2 - lng1) * t, _DECIMALES_COORD)]
+        for (lat1, lng1), (lat2, lng2) in zip(ruta, ruta[1:])
+        for t in fracciones
+    ]
+    puntos.append(list(ruta[-1]))
+    return puntos
+
+
+# Trayectorias precalculadas: el navegador solo avanza un índice por frame.
+# Se construyen en diccionarios nuevos y de solo lectura (tuplas dentro), así
+# _RUTAS_PREDEFINIDAS no se toca y generar_rutas_taxis puede compartirlas
+_RUTAS_TAXIS = tuple(
+    MappingProxyType({
+        **ruta,
+        "ruta": tuple(map(tuple, ruta["ruta"])),
+        "puntos": tuple(map(tuple, _interpolar_ruta(ruta["ruta"]))),
+    })
+    for ruta in _RUTAS_PREDEFINIDAS
+)
+
+
 def generar_rutas_taxis(num_taxis):
     """
     Genera rutas desde puntos de inicio hasta Sol para cada taxi.
@@ -58,183 +256,53 @@ def generar_rutas_taxis(num_taxis):
         num_taxis: Número de taxis a generar rutas
     
     Returns:
-        Lista de diccionarios con rutas
+        Tupla de rutas de solo lectura (compartidas entre llamadas)
     """
-    # Ruta principal (destino común)
-    sol = config.CENTRO_MADRID
-    
-    # Rutas predefinidas para diferentes taxis
-    rutas_predefinidas = [
-        # Taxi 1: Desde Ópera
-        {
-            "nombre": "Taxi 1 (Ópera)",
-            "ruta": [
-                [40.4178, -3.7094],
-                [40.4177, -3.7085],
-                [40.4168, -3.7047],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "orange",
-            "bg": "orange"
-        },
-        # Taxi 2: Desde Plaza España
-        {
-            "nombre": "Taxi 2 (Plaza España)",
-            "ruta": [
-                [40.4234, -3.7109],
-                [40.4203, -3.7059],
-                [40.4200, -3.7014],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "purple",
-            "bg": "purple"
-        },
-        # Taxi 3: Desde Retiro
-        {
-            "nombre": "Taxi 3 (Retiro)",
-            "ruta": [
-                [40.4153, -3.6840],
-                [40.4170, -3.6890],
-                [40.4185, -3.6950],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "red",
-            "bg": "red"
-        },
-        # Taxi 4: Desde Embajadores
-        {
-            "nombre": "Taxi 4 (Embajadores)",
-            "ruta": [
-                [40.4050, -3.7026],
-                [40.4075, -3.6934],
-                [40.4087, -3.6920],
-                [40.4152, -3.6943],
-                [40.4193, -3.6936],
-                [40.4178, -3.6995],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "darkgreen",
-            "bg": "green"
-        },
-        # Taxi 5: Desde Argüelles
-        {
-            "nombre": "Taxi 5 (Argüelles)",
-            "ruta": [
-                [40.4306, -3.7162],
-                [40.4263, -3.7132],
-                [40.4235, -3.7148],
-                [40.4219, -3.7132],
-                [40.4203, -3.7154],
-                [40.4203, -3.7200],
-                [40.4139, -3.7209],
-                [40.4139, -3.7168],
-                [40.4110, -3.7183],
-                [40.4087, -3.7167],
-                [40.4065, -3.7114],
-                [40.4086, -3.7131],
-                [40.4106, -3.7139],
-                [40.4150, -3.7135],
-                [40.4155, -3.7104],
-                [40.4161, -3.7078],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "gray",
-            "bg": "gray"
-        },
-        # Taxi 6: Desde Gran Vía
-        {
-            "nombre": "Taxi 6 (Gran Vía)",
-            "ruta": [
-                [40.4200, -3.7100],
-                [40.4190, -3.7070],
-                [40.4175, -3.7045],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "blue",
-            "bg": "blue"
-        },
-        # Taxi 7: Desde Atocha
-        {
-            "nombre": "Taxi 7 (Atocha)",
-            "ruta": [
-                [40.4100, -3.6900],
-                [40.4120, -3.6920],
-                [40.4145, -3.6980],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "pink",
-            "bg": "pink"
-        },
-        # Taxi 8: Desde Salamanca
-        {
-            "nombre": "Taxi 8 (Salamanca)",
-            "ruta": [
-                [40.4250, -3.6850],
-                [40.4220, -3.6900],
-                [40.4190, -3.6950],
-                [sol["lat"], sol["lng"]]
-            ],
-            "color": "brown",
-            "bg": "brown"
-        }
-    ]
-    
     # Devolver solo las rutas necesarias
-    return rutas_predefinidas[:num_taxis]
+    return _RUTAS_TAXIS[:num_taxis]
 
 
-# ==================== GENERACIÓN DE HTML ====================
+# ==================== CACHÉ DEL HTML ====================
 
-def generar_mapa_html(taxistas_registrados):
+def _calcular_cache_key(valores):
     """
-    Genera el archivo HTML del mapa animado.
+    Clave de invalidación del mapa: cambia si cambian los datos que se
+    insertan en la página, la configuración o la plantilla de este módulo.
     
     Args:
-        taxistas_registrados: Lista de taxis desde el JSON
+        valores: Diccionario hueco -> bytes con los datos de la página
     
     Returns:
-        Ruta del archivo HTML generado
+        Clave serializada en JSON
     """
-    num_taxis = min(len(taxistas_registrados), 8)  # Máximo 8 taxis
-    
-    # Asociar cada taxi con su taxista
-    taxi_taxista_map = {}
-    for i in range(num_taxis):
-        taxi_id = f"taxi{i+1}"
-        if i < len(taxistas_registrados):
-            taxista = taxistas_registrados[i]
-            taxi_taxista_map[taxi_id] = {
-                "nombre": taxista.get("nombre", taxista.get("nombre_completo", "Taxista")),
-                "placa": taxista.get("placa", "N/A"),
-                "identificacion": taxista.get("identificacion", taxista.get("cedula", "N/A")),
-                "fecha_registro": taxista.get("fecha_registro", "N/A"),
-                "estado": taxista.get("estado", "activo"),
-                "calificacion": taxista.get("calificacion_promedio", 5.0),
-                "servicios": taxista.get("cantidad_servicios", 0)
-            }
-    
-    # Generar rutas para los taxis
-    rutas_taxis = generar_rutas_taxis(num_taxis)
-    
-    # Mostrar asociaciones
-    print("\n🚕 ASOCIACIONES TAXI ↔ TAXISTA:")
-    for taxi_id, taxista in taxi_taxista_map.items():
-        print(f"   {taxi_id}: {taxista['nombre']} - Placa: {taxista['placa']}")
-    
-    # Convertir a JSON para JavaScript
-    taxistas_js = json.dumps(taxi_taxista_map, ensure_ascii=False)
-    rutas_js = json.dumps(rutas_taxis, ensure_ascii=False)
-    
-    # Ruta principal
-    ruta_principal = [[p[0], p[1]] for p in config.RUTA_PRINCIPAL]
-    ruta_principal_js = json.dumps(ruta_principal)
-    
-    # Centro del mapa
-    centro = config.CENTRO_MADRID
-    radio_busqueda = config.TAXI_CONFIG["RADIO_BUSQUEDA_KM"] * 1000  # Convertir a metros
-    
-    # Generar HTML
-    html_code = f"""
+    resumen = hashlib.sha256()
+    for hueco in _HUECOS_DINAMICOS:
+        resumen.update(valores[hueco])
+        resumen.update(b"\0")
+    key = [
+        resumen.hexdigest(),
+        config.VERSION,
+        os.path.getmtime(config.__file__),
+        os.path.getmtime(__file__),
+    ]
+    return json.dumps(key)
+
+
+def _leer_cache_key():
+    """Lee la clave de la última generación (None si no existe)"""
+    try:
+        with open(ARCHIVO_CACHE_KEY, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+# ==================== PLANTILLA HTML ====================
+
+# Huecos que cambian en cada generación; el resto sale de config
+_HUECOS_DINAMICOS = ("num_taxis", "taxistas_js", "taxis_order_js", "rutas_js")
+
+_HTML_PLANTILLA = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -243,9 +311,9 @@ def generar_mapa_html(taxistas_registrados):
     <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"/>
     <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
     <style>
-        body {{ margin: 0; padding: 0; font-family: Arial, sans-serif; }}
-        #map {{ position: absolute; top: 0; bottom: 0; width: 100%; }}
-        .taxi-marker {{
+        body { margin: 0; padding: 0; font-family: Arial, sans-serif; }
+        #map { position: absolute; top: 0; bottom: 0; width: 100%; }
+        .taxi-marker {
             width: 35px;
             height: 35px;
             border: 3px solid black;
@@ -253,8 +321,8 @@ def generar_mapa_html(taxistas_registrados):
             text-align: center;
             line-height: 29px;
             font-size: 20px;
-        }}
-        .controls {{
+        }
+        .controls {
             position: absolute;
             top: 10px;
             right: 10px;
@@ -266,22 +334,22 @@ def generar_mapa_html(taxistas_registrados):
             max-width: 320px;
             max-height: 90vh;
             overflow-y: auto;
-        }}
-        .controls h3 {{
+        }
+        .controls h3 {
             margin: 0 0 10px 0;
             font-size: 16px;
             color: #333;
-        }}
-        .controls label {{
+        }
+        .controls label {
             display: block;
             margin: 8px 0;
             cursor: pointer;
             font-size: 13px;
-        }}
-        .controls input {{
+        }
+        .controls input {
             margin-right: 8px;
-        }}
-        .btn {{
+        }
+        .btn {
             margin-top: 10px;
             padding: 10px 15px;
             background: #27ae60;
@@ -292,24 +360,24 @@ def generar_mapa_html(taxistas_registrados):
             width: 100%;
             font-size: 14px;
             font-weight: bold;
-        }}
-        .btn:hover {{
+        }
+        .btn:hover {
             background: #229954;
-        }}
-        .btn-reset {{
+        }
+        .btn-reset {
             background: #e74c3c;
             margin-top: 5px;
-        }}
-        .btn-reset:hover {{
+        }
+        .btn-reset:hover {
             background: #c0392b;
-        }}
-        .taxista-info {{
+        }
+        .taxista-info {
             font-size: 11px;
             color: #666;
             margin-left: 28px;
             line-height: 1.4;
-        }}
-        .header {{
+        }
+        .header {
             position: absolute;
             top: 10px;
             left: 10px;
@@ -318,18 +386,18 @@ def generar_mapa_html(taxistas_registrados):
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.3);
             z-index: 1000;
-        }}
-        .header h2 {{
+        }
+        .header h2 {
             margin: 0;
             font-size: 18px;
             color: #2c3e50;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 5px 0 0 0;
             font-size: 12px;
             color: #7f8c8d;
-        }}
-        .stats {{
+        }
+        .stats {
             position: absolute;
             bottom: 10px;
             left: 10px;
@@ -339,10 +407,10 @@ def generar_mapa_html(taxistas_registrados):
             box-shadow: 0 2px 10px rgba(0,0,0,0.3);
             z-index: 1000;
             font-size: 12px;
-        }}
-        .stats strong {{
+        }
+        .stats strong {
             color: #2c3e50;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -350,12 +418,12 @@ def generar_mapa_html(taxistas_registrados):
     
     <div class="header">
         <h2>🚖 UNIETAXI - Sistema en Tiempo Real</h2>
-        <p>Radio de búsqueda: {config.TAXI_CONFIG['RADIO_BUSQUEDA_KM']} km | {num_taxis} taxis activos</p>
+        <p>Radio de búsqueda: $radio_km km | $num_taxis taxis activos</p>
     </div>
     
     <div class="stats" id="stats">
         <strong>📊 Estadísticas:</strong><br>
-        Taxis activos: <span id="stat-activos">{num_taxis}</span><br>
+        Taxis activos: <span id="stat-activos">$num_taxis</span><br>
         Taxis en movimiento: <span id="stat-movimiento">0</span>
     </div>
     
@@ -368,14 +436,20 @@ def generar_mapa_html(taxistas_registrados):
     
     <script>
         // Datos de taxistas
-        var taxistasData = {taxistas_js};
+        var taxistasData = $taxistas_js;
+        
+        // Orden de los taxis (explícito, sin depender de Object.keys)
+        var taxisOrder = $taxis_order_js;
         
         // Rutas de taxis
-        var rutasTaxis = {rutas_js};
+        var rutasTaxis = $rutas_js;
+        
+        // Taxis seleccionados, mantenido por los checkboxes
+        var activosCount = $num_taxis;
         
         // Crear controles dinámicamente
         var controlsDiv = document.getElementById('taxi-controls');
-        Object.keys(taxistasData).forEach(function(taxiId, index) {{
+        taxisOrder.forEach(function(taxiId, index) {
             var taxista = taxistasData[taxiId];
             var ruta = rutasTaxis[index];
             
@@ -384,220 +458,339 @@ def generar_mapa_html(taxistas_registrados):
             checkbox.type = 'checkbox';
             checkbox.id = taxiId;
             checkbox.checked = true;
+            checkbox.addEventListener('change', function() {
+                activosCount += this.checked ? 1 : -1;
+                statAct.textContent = activosCount;
+            });
             
-            var emoji = ['🟠', '🟣', '🔴', '🟢', '⚫', '🔵', '🌸', '🟤'][index];
-            var text = emoji + ' ' + ruta.nombre;
+            var text = taxista.emoji + ' ' + ruta.nombre;
             
             label.appendChild(checkbox);
             label.appendChild(document.createTextNode(text));
             
             var infoDiv = document.createElement('div');
             infoDiv.className = 'taxista-info';
-            infoDiv.innerHTML = '👤 ' + taxista.nombre + '<br>🚗 ' + taxista.placa;
-            if (taxista.calificacion) {{
-                infoDiv.innerHTML += '<br>⭐ ' + taxista.calificacion.toFixed(1);
-            }}
+            // Armar el contenido completo y asignarlo una sola vez
+            var parts = ['👤 ', taxista.nombre, '<br>🚗 ', taxista.placa];
+            if (taxista.calificacion) {
+                parts.push('<br>⭐ ', taxista.calificacion.toFixed(1));
+            }
+            infoDiv.innerHTML = parts.join('');
             label.appendChild(infoDiv);
             
             controlsDiv.appendChild(label);
-        }});
+        });
         
         // Crear mapa
-        var map = L.map('map').setView([{centro['lat']}, {centro['lng']}], 14);
+        var map = L.map('map').setView([$centro_lat, $centro_lng], 14);
         
         // Añadir capa de OpenStreetMap
-        L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
-            attribution: '© OpenStreetMap | UNIETAXI Sistema v{config.VERSION}'
-        }}).addTo(map);
+        L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+            attribution: '© OpenStreetMap | UNIETAXI Sistema v$version'
+        }).addTo(map);
         
         // Ruta principal (azul)
-        var rutaPrincipal = {ruta_principal_js};
-        L.polyline(rutaPrincipal, {{color: 'blue', weight: 5, opacity: 0.8}}).addTo(map);
+        var rutaPrincipal = $ruta_principal_js;
+        L.polyline(rutaPrincipal, {color: 'blue', weight: 5, opacity: 0.8}).addTo(map);
         
         // Marcadores de ruta principal
-        L.marker([{centro['lat']}, {centro['lng']}]).addTo(map)
-            .bindPopup('<b>{centro['nombre']}</b><br>Punto de encuentro');
+        L.marker([$centro_lat, $centro_lng]).addTo(map)
+            .bindPopup('<b>$centro_nombre</b><br>Punto de encuentro');
         
         // Círculo de radio de búsqueda
-        L.circle([{centro['lat']}, {centro['lng']}], {{
-            radius: {radio_busqueda},
+        L.circle([$centro_lat, $centro_lng], {
+            radius: $radio_busqueda,
             color: 'white',
             fillColor: 'white',
             fillOpacity: 0.1
-        }}).addTo(map).bindPopup('Radio de búsqueda: {config.TAXI_CONFIG['RADIO_BUSQUEDA_KM']} km');
+        }).addTo(map).bindPopup('Radio de búsqueda: $radio_km km');
         
         // Dibujar las rutas de los taxis
-        rutasTaxis.forEach(function(taxi, index) {{
-            L.polyline(taxi.ruta, {{
+        rutasTaxis.forEach(function(taxi, index) {
+            L.polyline(taxi.ruta, {
                 color: taxi.color,
                 weight: 4,
                 opacity: 0.6,
                 dashArray: '5, 5'
-            }}).addTo(map);
+            }).addTo(map);
             
             // Marcador de inicio
             var taxista = taxistasData['taxi' + (index + 1)];
             var popupText = taxi.nombre + ' - Partida';
-            if (taxista) {{
+            if (taxista) {
                 popupText += '<br><b>Taxista:</b> ' + taxista.nombre;
                 popupText += '<br><b>Placa:</b> ' + taxista.placa;
-            }}
+            }
             L.marker(taxi.ruta[0]).addTo(map).bindPopup(popupText);
-        }});
+        });
         
         // Variables globales para animación
         var taxiMarkers = [];
         var taxiStates = [];
         var animationRunning = false;
         
+        // Referencias a los contadores, resueltas una sola vez
+        var statMov = document.getElementById('stat-movimiento');
+        var statAct = document.getElementById('stat-activos');
+        
+        // Ritmo de la animación: un punto de trayectoria cada MS_POR_PASO ms
+        var MS_POR_PASO = 30;
+        var ultimoFrame = null;
+        var pasosAcumulados = 0;
+        
         // Inicializar marcadores
-        rutasTaxis.forEach(function(taxi, i) {{
-            var icon = L.divIcon({{
+        rutasTaxis.forEach(function(taxi, i) {
+            var icon = L.divIcon({
                 className: 'taxi-marker',
                 html: '<div style="background: ' + taxi.bg + '; width: 100%; height: 100%; border-radius: 50%; display: flex; align-items: center; justify-content: center;">🚕</div>',
                 iconSize: [35, 35]
-            }});
+            });
             
-            var marker = L.marker(taxi.ruta[0], {{icon: icon}}).addTo(map);
+            var marker = L.marker(taxi.ruta[0], {icon: icon}).addTo(map);
             
             // Popup con información del taxista
             var taxista = taxistasData['taxi' + (i + 1)];
             var popupContent = '<b>' + taxi.nombre + '</b>';
-            if (taxista) {{
+            if (taxista) {
                 popupContent += '<br>👤 ' + taxista.nombre;
                 popupContent += '<br>🚗 ' + taxista.placa;
-                if (taxista.calificacion) {{
+                if (taxista.calificacion) {
                     popupContent += '<br>⭐ ' + taxista.calificacion.toFixed(1);
-                }}
-                if (taxista.servicios) {{
+                }
+                if (taxista.servicios) {
                     popupContent += '<br>📊 ' + taxista.servicios + ' servicios';
-                }}
-            }}
+                }
+            }
             marker.bindPopup(popupContent);
             
             taxiMarkers.push(marker);
-            taxiStates.push({{
+            taxiStates.push({
                 id: 'taxi' + (i + 1),
-                index: 0,
-                step: 0,
-                totalSteps: 50,
-                ruta: taxi.ruta,
+                paso: 0,
+                puntos: taxi.puntos,
                 nombre: taxi.nombre,
                 finished: false,
                 activo: true
-            }});
-        }});
+            });
+        });
         
         // Función para iniciar la animación
-        function iniciarAnimacion() {{
+        function iniciarAnimacion() {
             // Leer qué taxis están seleccionados
-            taxiStates.forEach(function(state) {{
+            taxiStates.forEach(function(state) {
                 var checkbox = document.getElementById(state.id);
                 state.activo = checkbox.checked;
-            }});
+            });
             
-            if (!animationRunning) {{
+            if (!animationRunning) {
                 animationRunning = true;
-                animateAllTaxis();
-            }}
-        }}
+                ultimoFrame = null;
+                pasosAcumulados = 0;
+                requestAnimationFrame(animateAllTaxis);
+            }
+        }
         
         // Función para resetear
-        function resetearAnimacion() {{
+        function resetearAnimacion() {
             animationRunning = false;
-            taxiStates.forEach(function(state, i) {{
+            taxiStates.forEach(function(state, i) {
                 state.finished = false;
-                state.index = 0;
-                state.step = 0;
-                taxiMarkers[i].setLatLng(state.ruta[0]);
-            }});
-            actualizarEstadisticas();
-        }}
+                state.paso = 0;
+                taxiMarkers[i].setLatLng(state.puntos[0]);
+            });
+        }
         
         // Función de animación para todos los taxis
-        function animateAllTaxis() {{
+        function animateAllTaxis(ahora) {
+            // Reiniciar detiene el bucle
+            if (!animationRunning) return;
+            
+            // Pasos completos según el tiempo real transcurrido desde el frame anterior
+            if (ultimoFrame !== null) {
+                pasosAcumulados += (ahora - ultimoFrame) / MS_POR_PASO;
+            }
+            ultimoFrame = ahora;
+            var avance = Math.floor(pasosAcumulados);
+            pasosAcumulados -= avance;
+            
             var allFinished = true;
             var enMovimiento = 0;
             
-            taxiStates.forEach(function(state, i) {{
+            taxiStates.forEach(function(state, i) {
                 if (!state.activo) return;
                 
-                if (!state.finished && state.index < state.ruta.length - 1) {{
+                if (!state.finished && state.paso < state.puntos.length - 1) {
                     allFinished = false;
                     enMovimiento++;
-                    state.step++;
                     
-                    if (state.step > state.totalSteps) {{
-                        state.step = 0;
-                        state.index++;
-                    }}
-                    
-                    if (state.index < state.ruta.length - 1) {{
-                        var lat1 = state.ruta[state.index][0];
-                        var lng1 = state.ruta[state.index][1];
-                        var lat2 = state.ruta[state.index + 1][0];
-                        var lng2 = state.ruta[state.index + 1][1];
-                        
-                        var fraction = state.step / state.totalSteps;
-                        var currentLat = lat1 + (lat2 - lat1) * fraction;
-                        var currentLng = lng1 + (lng2 - lng1) * fraction;
-                        
-                        taxiMarkers[i].setLatLng([currentLat, currentLng]);
-                    }}
-                }} else if (!state.finished) {{
+                    // Trayectoria ya interpolada en Python: solo avanzar
+                    if (avance > 0) {
+                        state.paso = Math.min(state.paso + avance, state.puntos.length - 1);
+                        taxiMarkers[i].setLatLng(state.puntos[state.paso]);
+                    }
+                } else if (!state.finished) {
                     // Taxi llegó a Sol
                     state.finished = true;
                     var taxista = taxistasData[state.id];
-                    var arrivedMsg = '✅ ' + state.nombre + ' - ¡Llegó a {centro["nombre"]}!';
-                    if (taxista) {{
+                    var arrivedMsg = '✅ ' + state.nombre + ' - ¡Llegó a $centro_nombre!';
+                    if (taxista) {
                         arrivedMsg += '<br>Taxista: ' + taxista.nombre;
-                    }}
+                    }
                     taxiMarkers[i].bindPopup(arrivedMsg).openPopup();
-                    setTimeout(function() {{ taxiMarkers[i].closePopup(); }}, 3000);
-                }}
-            }});
+                    setTimeout(function() { taxiMarkers[i].closePopup(); }, 3000);
+                }
+            });
             
             // Actualizar estadísticas
-            document.getElementById('stat-movimiento').textContent = enMovimiento;
+            statMov.textContent = enMovimiento;
             
-            if (!allFinished) {{
-                setTimeout(animateAllTaxis, 30);
-            }} else {{
+            if (!allFinished) {
+                requestAnimationFrame(animateAllTaxis);
+            } else {
                 animationRunning = false;
-                console.log('Todos los taxis activos llegaron a {centro["nombre"]}');
-            }}
-        }}
-        
-        function actualizarEstadisticas() {{
-            var activos = taxiStates.filter(s => s.activo).length;
-            document.getElementById('stat-activos').textContent = activos;
-        }}
+                console.log('Todos los taxis activos llegaron a $centro_nombre');
+            }
+        }
     </script>
 </body>
 </html>
 """
+
+# Ruta principal como pares [lat, lng] (config incluye el nombre de cada punto)
+_RUTA_PRINCIPAL = [[lat, lng] for lat, lng, _ in config.RUTA_PRINCIPAL]
+
+# Valores fijos de configuración, sustituidos una sola vez al importar
+_CTX_CONFIG = {
+    "ruta_principal_js": _JSON_COMPACTO.encode(_RUTA_PRINCIPAL),
+    "radio_km": config.TAXI_CONFIG["RADIO_BUSQUEDA_KM"],
+    "radio_busqueda": config.TAXI_CONFIG["RADIO_BUSQUEDA_KM"] * 1000,  # En metros
+    "centro_lat": config.CENTRO_MADRID["lat"],
+    "centro_lng": config.CENTRO_MADRID["lng"],
+    "centro_nombre": config.CENTRO_MADRID["nombre"],
+    "version": config.VERSION,
+}
+
+# Partes estáticas ya codificadas en UTF-8 y el hueco que sigue a cada una
+_trozos = re.split(r"\$(" + "|".join(_HUECOS_DINAMICOS) + r")\b", _HTML_PLANTILLA)
+_HTML_ESTATICO = tuple(
+    string.Template(trozo).substitute(_CTX_CONFIG).encode("utf-8")
+    for trozo in _trozos[0::2]
+)
+_HTML_HUECOS = tuple(_trozos[1::2])
+del _trozos
+
+
+def _partes_html(valores):
+    """
+    Recorre la página en orden: partes estáticas intercaladas con los huecos.
+    
+    Args:
+        valores: Diccionario hueco -> bytes
+    
+    Yields:
+        Fragmentos de la página en bytes UTF-8
+    """
+    yield _HTML_ESTATICO[0]
+    for hueco, estatico in zip(_HTML_HUECOS, _HTML_ESTATICO[1:]):
+        yield valores[hueco]
+        yield estatico
+
+
+# ==================== GENERACIÓN DE HTML ====================
+
+def generar_mapa_html(taxistas_registrados, verbose=False):
+    """
+    Genera el archivo HTML del mapa animado.
+    
+    Si los datos de la página y la configuración no cambiaron desde la
+    última generación, reutiliza el HTML existente sin reescribirlo.
+    
+    Args:
+        taxistas_registrados: Lista de taxis desde el JSON
+        verbose: Si True, muestra asociaciones, detalle de taxis e instrucciones
+    
+    Returns:
+        Ruta del archivo HTML generado
+    """
+    num_taxis = min(len(taxistas_registrados), 8)  # Máximo 8 taxis
+    
+    # Asociar cada taxi con su taxista
+    taxi_taxista_map = {}
+    for i in range(num_taxis):
+        taxi_id = f"taxi{i+1}"
+        if i < len(taxistas_registrados):
+            taxista = taxistas_registrados[i]
+            taxi_taxista_map[taxi_id] = {
+                "nombre": taxista.get("nombre", taxista.get("nombre_completo", "Taxista")),
+                "placa": taxista.get("placa", "N/A"),
+                "identificacion": taxista.get("identificacion", taxista.get("cedula", "N/A")),
+                "fecha_registro": taxista.get("fecha_registro", "N/A"),
+                "estado": taxista.get("estado", "activo"),
+                "calificacion": taxista.get("calificacion_promedio", 5.0),
+                "servicios": taxista.get("cantidad_servicios", 0),
+                "emoji": _EMOJIS_TAXI[i]
+            }
     
-    # Guardar el HTML
-    with open(config.MAPA_HTML, "w", encoding="utf-8") as f:
-        f.write(html_code)
+    # Generar rutas para los taxis
+    rutas_taxis = generar_rutas_taxis(num_taxis)
+    
+    # Mostrar asociaciones
+    if verbose:
+        print("\n🚕 ASOCIACIONES TAXI ↔ TAXISTA:")
+        for taxi_id, taxista in taxi_taxista_map.items():
+            print(f"   {taxi_id}: {taxista['nombre']} - Placa: {taxista['placa']}")
+    
+    # Convertir a JSON para JavaScript
+    taxistas_js = _JSON_COMPACTO.encode(taxi_taxista_map)
+    taxis_order_js = _JSON_COMPACTO.encode(list(taxi_taxista_map))
+    rutas_js = _JSON_COMPACTO.encode(rutas_taxis)
     
-    print(f"\n✅ Archivo '{config.MAPA_HTML}' creado con éxito")
-    print(f"\n📋 INFORMACIÓN DE LOS TAXIS:")
-    for taxi_id, taxista in taxi_taxista_map.items():
-        print(f"\n   {taxi_id.upper()}:")
-        print(f"   👤 Taxista: {taxista['nombre']}")
-        print(f"   🚗 Placa: {taxista['placa']}")
-        print(f"   📋 ID: {taxista['identificacion']}")
-        if taxista.get('calificacion'):
-            print(f"   ⭐ Calificación: {taxista['calificacion']:.1f}")
-        if taxista.get('servicios'):
-            print(f"   📊 Servicios: {taxista['servicios']}")
+    # Valores de los huecos dinámicos, codificados una vez
+    valores = {
+        "num_taxis": str(num_taxis).encode("utf-8"),
+        "taxistas_js": taxistas_js.encode("utf-8"),
+        "taxis_order_js": taxis_order_js.encode("utf-8"),
+        "rutas_js": rutas_js.encode("utf-8"),
+    }
     
-    print(f"\n🎮 CÓMO USAR:")
-    print(f"   1. Abre {config.MAPA_HTML} en tu navegador")
-    print(f"   2. Usa el panel de control para activar/desactivar taxis")
-    print(f"   3. Haz clic en 'Iniciar Animación' para ver los taxis moverse")
-    print(f"   4. Haz clic en los marcadores para ver información detallada")
+    # Reutilizar el HTML si ya se generó con estos mismos datos
+    cache_key = _calcular_cache_key(valores)
+    reutilizado = (os.path.exists(config.MAPA_HTML) and os.path.exists(ARCHIVO_MAPA_GZ)
+                   and _leer_cache_key() == cache_key)
+    
+    if not reutilizado:
+        # Escribir el HTML por partes, sin armar la página completa en memoria,
+        # y en la misma pasada su copia .gz (mtime=0 para que sea reproducible)
+        with open(config.MAPA_HTML, "wb", buffering=65536) as f, \
+                gzip.GzipFile(ARCHIVO_MAPA_GZ, "wb", compresslevel=6, mtime=0) as gz:
+            for parte in _partes_html(valores):
+                f.write(parte)
+                gz.write(parte)
+        
+        with open(ARCHIVO_CACHE_KEY, "w", encoding="utf-8") as f:
+            f.write(cache_key)
+    
+    if verbose:
+        if reutilizado:
+            print(f"\n♻️  '{config.MAPA_HTML}' sin cambios, se reutiliza")
+        else:
+            print(f"\n✅ Archivo '{config.MAPA_HTML}' creado con éxito")
+        print(f"\n📋 INFORMACIÓN DE LOS TAXIS:")
+        for taxi_id, taxista in taxi_taxista_map.items():
+            print(f"\n   {taxi_id.upper()}:")
+            print(f"   👤 Taxista: {taxista['nombre']}")
+            print(f"   🚗 Placa: {taxista['placa']}")
+            print(f"   📋 ID: {taxista['identificacion']}")
+            if taxista.get('calificacion'):
+                print(f"   ⭐ Calificación: {taxista['calificacion']:.1f}")
+            if taxista.get('servicios'):
+                print(f"   📊 Servicios: {taxista['servicios']}")
+        
+        print(f"\n🎮 CÓMO USAR:")
+        print(f"   1. Abre {config.MAPA_HTML} en tu navegador")
+        print(f"   2. Usa el panel de control para activar/desactivar taxis")
+        print(f"   3. Haz clic en 'Iniciar Animación' para ver los taxis moverse")
+        print(f"   4. Haz clic en los marcadores para ver información detallada")
     
     return config.MAPA_HTML
 
@@ -621,7 +814,7 @@ def main():
         return
     
     # Generar mapa
-    archivo_html = generar_mapa_html(taxistas)
+    archivo_html = generar_mapa_html(taxistas, verbose=True)
     
     print("\n" + "="*60)
     print("✅ Mapa generado correctamente")